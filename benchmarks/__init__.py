@@ -0,0 +1,7 @@
+"""
+Benchmarks for typing_inspect_lib.
+
+Each module can be run on its own, for example:
+
+    python -m benchmarks.bench_get_typing
+"""
@@ -0,0 +1,77 @@
+"""
+Compare `get_bases` on specialised aliases against the implementation it replaced.
+
+Run with:
+
+    python -m benchmarks.bench_get_bases
+"""
+from __future__ import print_function
+
+import collections
+import timeit
+import typing
+
+from typing_inspect_lib import get_bases, get_parameters, get_type_info
+from typing_inspect_lib.core.helpers import is_typing
+from typing_inspect_lib.extras.get_bases import _BaseObj, _bases
+
+
+def _previous(type_):
+    """The `get_bases` used before the per class templates."""
+    type_info = get_type_info(type_)
+    if type_info is None:
+        return _bases(type_)
+    if (
+        not type_info.args
+        or not is_typing(type_info.class_)
+    ):
+        return _bases(type_info.class_)
+    bases = ()
+    for base in _bases(type_info.class_):
+        if not is_typing(base.class_):
+            bases += (base,)
+        else:
+            parameters = get_parameters(base.typing)
+            if parameters:
+                bases += (_BaseObj(
+                    base.typing,
+                    base.class_,
+                    base.typing[type_info.args[:len(parameters)]],
+                ),)
+            else:
+                bases += (base,)
+    return bases
+
+
+def build_cases():
+    """Build the types to time, as `(name, type)`."""
+    return [
+        ('List[int]', typing.List[int]),
+        ('Mapping[str, int]', typing.Mapping[str, int]),
+        ('Dict[str, int]', typing.Dict[str, int]),
+        ('Generator[int, str, bytes]', typing.Generator[int, str, bytes]),
+    ]
+
+
+def run(number=2000, repeat=3):
+    """Return `{name: (previous seconds, current seconds)}`."""
+    results = collections.OrderedDict()
+    for name, type_ in build_cases():
+        if _previous(type_) != get_bases(type_):
+            raise ValueError('Results differ for {0}'.format(name))
+        results[name] = tuple(
+            min(timeit.repeat(lambda fn=fn: fn(type_), number=number, repeat=repeat))
+            / number
+            for fn in (_previous, get_bases)
+        )
+    return results
+
+
+def main():
+    print('{0:<28} {1:>12} {2:>12}'.format('type', 'previous us', 'current us'))
+    for name, (previous, current) in run().items():
+        print('{0:<28} {1:>12.2f} {2:>12.2f}'.format(name, previous * 1e6, current * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Compare `get_generic_args_for` against finding the ancestor in `get_mro_orig`.
+
+Hierarchies are built by `benchmarks.hierarchies`. The scan doesn't resolve
+TypeVars through user generics, so the results are checked against the
+expected arguments rather than the scan. Run with:
+
+    python -m benchmarks.bench_get_generic_args_for
+"""
+from __future__ import print_function
+
+import collections
+import timeit
+import typing
+
+from typing_inspect_lib import get_args, get_generic_args_for, get_mro_orig
+
+from .hierarchies import deep, wide
+
+
+def _scan(type_, ancestor):
+    """Find the arguments of the ancestor by scanning the whole MRO."""
+    for base in get_mro_orig(type_):
+        if base.class_ is ancestor:
+            return get_args(base.orig) if base.orig is not None else ()
+    return None
+
+
+def build_cases():
+    """Build the queries to time, as `(name, type, ancestor, expected)`."""
+    cases = []
+    for depth in (10, 40):
+        type_ = deep(depth)
+        ancestor = type_.__mro__[depth - 1]
+        cases.append(('deep {0}'.format(depth), type_[int], ancestor, (int,)))
+    type_ = wide(3, 3)
+    cases.append(('wide 3x3', type_[int], type_.__mro__[-3], (int,)))
+    cases.append(('Dict[str, int]', typing.Dict[str, int], dict, (str, int)))
+    return cases
+
+
+def run(number=200, repeat=3):
+    """Return `{name: (scan seconds, get_generic_args_for seconds)}`."""
+    results = collections.OrderedDict()
+    for name, type_, ancestor, expected in build_cases():
+        if get_generic_args_for(type_, ancestor) != expected:
+            raise ValueError('Results differ for {0}'.format(name))
+        results[name] = tuple(
+            min(timeit.repeat(
+                lambda fn=fn: fn(type_, ancestor), number=number, repeat=repeat,
+            ))
+            / number
+            for fn in (_scan, get_generic_args_for)
+        )
+    return results
+
+
+def main():
+    print('{0:<16} {1:>10} {2:>10}'.format('query', 'scan us', 'query us'))
+    for name, (scan, query) in run().items():
+        print('{0:<16} {1:>10.1f} {2:>10.1f}'.format(name, scan * 1e6, query * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""
+Compare `get_mro_orig` against the implementation it replaced.
+
+The types are the partial specialisations and subclasses built by
+`tests.helpers.build_types`, the same as the unit tests use, and the
+hierarchies from `benchmarks.hierarchies`, which have long MROs. Run with:
+
+    python -m benchmarks.bench_get_mro_orig
+"""
+from __future__ import print_function
+
+import collections
+import operator
+import timeit
+import typing
+
+from typing_inspect_lib import get_args, get_mro, get_mro_orig, get_typing
+from typing_inspect_lib.core.helpers import pairwise
+from typing_inspect_lib.extras.get_bases import _BaseObj
+from typing_inspect_lib.extras.get_mro_orig import _ensure_consumed_parents, _inner_set
+from typing_inspect_lib.extras.get_parents import get_parents
+
+from tests.helpers.build_types import _build_tests
+
+from .hierarchies import deep, wide
+
+TKey = typing.TypeVar('TKey')
+TValue = typing.TypeVar('TValue')
+TSend = typing.TypeVar('TSend')
+
+_TYPES = [
+    (typing.Iterable, [TValue], [int]),
+    (typing.Sequence, [TValue], [int]),
+    (typing.List, [TValue], [int]),
+    (typing.AbstractSet, [TValue], [int]),
+    (typing.Set, [TValue], [int]),
+    (typing.Mapping, [TKey, TValue], [str, int]),
+    (typing.MutableMapping, [TKey, TValue], [str, int]),
+    (typing.Dict, [TKey, TValue], [str, int]),
+    (typing.Generator, [TKey, TSend, TValue], [str, int, bytes]),
+]
+
+
+def _previous(type_):
+    """The `get_mro_orig` used before the single pass implementation."""
+    parents = {}
+    for parent in get_parents(type_):
+        parents.setdefault(parent.class_, []).append(parent)
+
+    mro = ()
+    for class_ in get_mro(type_):
+        if class_ not in parents:
+            t_typing, t_class = get_typing(class_)
+            mro += (_BaseObj(t_typing or class_, t_class or class_, None),)
+            continue
+
+        classes = parents.pop(class_)
+        if not all(a.typing is b.typing for a, b in pairwise(classes)):
+            raise ValueError('MRO has two different types using the same class')
+
+        if all(c.orig is None for c in classes):
+            mro += (classes[0],)
+            continue
+
+        args = _inner_set(get_args(c.orig) if c.orig is not None else {} for c in classes)
+        new_args = ()
+        for arg in args:
+            if len(arg) == 1:
+                new_args += (arg.pop(),)
+            else:
+                new_args += (typing.Union[tuple(arg)],)
+        class__ = classes[0]
+        mro += (_BaseObj(class__.typing, class__.class_, class__.typing[new_args]),)
+
+    _ensure_consumed_parents(type_, parents)
+    return mro
+
+
+def build_corpus():
+    """Build the types from `tests.helpers.build_types`."""
+    corpus = []
+    for type_, t_args, args in _TYPES:
+        # Like the unit tests, multiple arguments are specialised together.
+        fn = operator.ge if len(t_args) == 1 else operator.eq
+        for _, obj, _, _, _, _ in _build_tests(type_, t_args, args, 0, 3, 2, fn):
+            corpus.append(obj)
+    return corpus
+
+
+def build_cases():
+    """Build the types to time, as `(name, types)`."""
+    cases = [('build_types', build_corpus())]
+    cases += [('deep {0}'.format(depth), [deep(depth)]) for depth in (10, 40, 160)]
+    cases += [('wide 3x3', [wide(3, 3)])]
+    return cases
+
+
+def _all(function, types):
+    for type_ in types:
+        function(type_)
+
+
+def run(number=3, repeat=3):
+    """Return `{name: (types, previous seconds, current seconds)}`."""
+    results = collections.OrderedDict()
+    for name, types in build_cases():
+        for type_ in types:
+            if _previous(type_) != get_mro_orig(type_):
+                raise ValueError('Results differ for {0!r}'.format(type_))
+        results[name] = (len(types),) + tuple(
+            min(timeit.repeat(
+                lambda fn=fn: _all(fn, types), number=number, repeat=repeat,
+            ))
+            / number
+            for fn in (_previous, get_mro_orig)
+        )
+    return results
+
+
+def main():
+    print('{0:<12} {1:>6} {2:>12} {3:>12}'.format(
+        'types', 'count', 'previous ms', 'current ms',
+    ))
+    for name, (count, previous, current) in run().items():
+        print('{0:<12} {1:>6} {2:>12.2f} {3:>12.2f}'.format(
+            name, count, previous * 1e3, current * 1e3,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Compare `get_parents` against the recursive implementation it replaced.
+
+Hierarchies are built by `benchmarks.hierarchies`, and grow deeper and wider.
+Run with:
+
+    python -m benchmarks.bench_get_parents
+"""
+from __future__ import print_function
+
+import collections
+import timeit
+
+from typing_inspect_lib import get_type_info
+from typing_inspect_lib.extras.get_bases import _BaseObj, get_bases
+from typing_inspect_lib.extras.get_parents import get_parents
+
+from .hierarchies import deep, wide
+
+
+def _recursive_parents(type_):
+    parents = ()
+    for base in get_bases(type_):
+        parents += (base,)
+        parents += _recursive_parents(base.class_ if base.orig is None else base.orig)
+    return parents
+
+
+def _recursive(type_):
+    """The recursive `get_parents` used before the iterative walk."""
+    type_info = get_type_info(type_)
+    orig = type_ if type_info.args else None
+    parents = _recursive_parents(type_)
+    return (_BaseObj(type_info.typing, type_info.class_, orig),) + parents
+
+
+def build_cases():
+    """Build the hierarchies to time, as `(name, type)`."""
+    cases = [('deep {0}'.format(depth), deep(depth)) for depth in (5, 10, 20, 40)]
+    cases += [
+        ('wide {0}x{1}'.format(width, depth), wide(width, depth))
+        for width, depth in ((2, 2), (2, 4), (3, 3), (2, 6))
+    ]
+    return cases
+
+
+def run(number=5, repeat=3):
+    """Return `{name: (parents, recursive seconds, iterative seconds)}`."""
+    results = collections.OrderedDict()
+    for name, type_ in build_cases():
+        parents = get_parents(type_)
+        if _recursive(type_) != parents:
+            raise ValueError('Results differ for {0}'.format(name))
+        results[name] = (len(parents),) + tuple(
+            min(timeit.repeat(lambda fn=fn: fn(type_), number=number, repeat=repeat))
+            / number
+            for fn in (_recursive, get_parents)
+        )
+    return results
+
+
+def main():
+    print('{0:<10} {1:>8} {2:>14} {3:>14}'.format(
+        'hierarchy', 'parents', 'recursive ms', 'iterative ms',
+    ))
+    for name, (parents, recursive, iterative) in run().items():
+        print('{0:<10} {1:>8} {2:>14.3f} {3:>14.3f}'.format(
+            name, parents, recursive * 1e3, iterative * 1e3,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Compare `get_typing` against the chain of fallbacks it used before the dispatch table.
+
+Run with:
+
+    python -m benchmarks.bench_get_typing
+"""
+from __future__ import print_function
+
+import abc
+import collections
+import timeit
+import types
+import typing
+
+try:
+    import typing_extensions
+except ImportError:
+    typing_extensions = None
+
+from typing_inspect_lib import get_typing
+from typing_inspect_lib.core.get_typing import _get_typing
+from typing_inspect_lib.core.helpers import (
+    LITERAL_TYPES, PY_OLD, TYPING_OBJECTS, get_special_wrapped, safe_dict_get,
+    safe_dict_get_both, typing_,
+)
+from typing_inspect_lib.core.helpers import abc as abc_
+
+T = typing.TypeVar('T')
+
+
+class _Plain(object):  # pylint: disable=useless-object-inheritance
+    pass
+
+
+class _ABC(abc.ABCMeta('ABC', (object,), {})):
+    pass
+
+
+class _Generic(typing.Generic[T]):
+    pass
+
+
+def _chain(type_):
+    """The chain of fallbacks `get_typing` used before the dispatch table."""
+    if isinstance(type_, typing.TypeVar):
+        ret = typing.TypeVar, type_
+    elif isinstance(type_, typing_.ProtocolMeta):
+        ret = typing_.Protocol, type_
+    elif isinstance(type_, types.FunctionType) and hasattr(type_, '__supertype__'):
+        ret = typing_.NewType, type_
+    else:
+        ret = (
+            safe_dict_get(LITERAL_TYPES, type_)
+            or safe_dict_get_both(TYPING_OBJECTS.class_, type_, inv=True)
+            or safe_dict_get_both(TYPING_OBJECTS.typing, type_)
+            or _get_typing(type_)
+            or (get_special_wrapped(type_) if PY_OLD else None)
+        )
+    if ret is None:
+        return None, None
+    type_type, class_type = ret
+    if type_type is typing_.NewType:
+        class_type = type_
+    return type_type, class_type
+
+
+def build_inputs():
+    """Build one example of each kind of input `get_typing` handles."""
+    inputs = [
+        ('builtin', int),
+        ('literal', typing.Any),
+        ('type var', T),
+        ('new type', typing.NewType('UserId', int)),
+        ('typing', typing.Mapping),
+        ('class', abc_.Mapping),
+        ('specialised', typing.Mapping[str, int]),
+        ('union', typing.Union[str, int]),
+        ('callable', typing.Callable[[int], str]),
+        ('plain class', _Plain),
+        ('abc class', _ABC),
+        ('user generic', _Generic),
+        ('user specialised', _Generic[int]),
+        ('unknown', object()),
+        ('unhashable', [int]),
+    ]
+    if typing_extensions is not None and hasattr(typing_extensions, 'Protocol'):
+        # pylint: disable=too-few-public-methods
+        class _Protocol(typing_extensions.Protocol):
+            pass
+        inputs.append(('protocol', _Protocol))
+    return inputs
+
+
+def run(number=20000, repeat=3):
+    """Time both implementations, returning `{kind: (chain, dispatch)}` in seconds."""
+    results = collections.OrderedDict()
+    for kind, type_ in build_inputs():
+        if _chain(type_) != get_typing(type_):
+            raise ValueError('Results differ for {0!r}'.format(type_))
+        results[kind] = tuple(
+            min(timeit.repeat(lambda fn=fn: fn(type_), number=number, repeat=repeat))
+            / number
+            for fn in (_chain, get_typing)
+        )
+    return results
+
+
+def main():
+    print('{0:<18} {1:>10} {2:>10} {3:>8}'.format('kind', 'chain ns', 'get ns', 'saving'))
+    for kind, (chain, dispatch) in run().items():
+        print('{0:<18} {1:>10.1f} {2:>10.1f} {3:>7.0%}'.format(
+            kind, chain * 1e9, dispatch * 1e9, 1 - dispatch / chain,
+        ))
+
+
+if __name__ == '__main__':
+    main()
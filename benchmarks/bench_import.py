@@ -0,0 +1,83 @@
+"""
+Measure the time and memory taken to import typing_inspect_lib.
+
+Each case is run in a fresh interpreter, so nothing is already imported.
+Run with:
+
+    python -m benchmarks.bench_import
+"""
+from __future__ import print_function
+
+import collections
+import json
+import os
+import subprocess
+import sys
+
+_SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+_SCRIPT = '''
+import json
+import sys
+import timeit
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+import typing
+
+if tracemalloc is not None:
+    tracemalloc.start()
+modules = set(sys.modules)
+start = timeit.default_timer()
+{0}
+duration = timeit.default_timer() - start
+memory = tracemalloc.get_traced_memory()[0] if tracemalloc is not None else None
+print(json.dumps({{
+    'seconds': duration,
+    'bytes': memory,
+    'modules': len(set(sys.modules) - modules),
+}}))
+'''
+
+CASES = collections.OrderedDict([
+    ('core', 'import typing_inspect_lib\ntyping_inspect_lib.get_type_info(int)'),
+    ('extras', 'import typing_inspect_lib\ntyping_inspect_lib.get_mro(int)'),
+])
+
+
+def _run_case(code):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        path for path in [_SRC, env.get('PYTHONPATH')] if path
+    )
+    output = subprocess.check_output(
+        [sys.executable, '-c', _SCRIPT.format(code)],
+        env=env,
+    )
+    return json.loads(output.decode('utf-8'))
+
+
+def run(repeat=5):
+    """Run each case, returning `{case: result}` with the fastest time of each."""
+    results = collections.OrderedDict()
+    for name, code in CASES.items():
+        runs = [_run_case(code) for _ in range(repeat)]
+        results[name] = min(runs, key=lambda result: result['seconds'])
+    return results
+
+
+def main():
+    print('{0:<8} {1:>8} {2:>10} {3:>8}'.format('case', 'ms', 'KiB', 'modules'))
+    for name, result in run().items():
+        memory = result['bytes']
+        print('{0:<8} {1:>8.2f} {2:>10} {3:>8}'.format(
+            name,
+            result['seconds'] * 1e3,
+            '-' if memory is None else '{0:.1f}'.format(memory / 1024.0),
+            result['modules'],
+        ))
+
+
+if __name__ == '__main__':
+    main()
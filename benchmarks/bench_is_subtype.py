@@ -0,0 +1,63 @@
+"""
+Time `is_subtype` over synthetic corpora, for first and repeated checks of each pair.
+
+Each type of the corpus is checked against a fixed set of targets, taken from
+the corpus, as a registry matching handlers against types would. Run with:
+
+    python -m benchmarks.bench_is_subtype
+    python -m benchmarks.bench_is_subtype --sizes 1000 10000 --targets 50
+"""
+from __future__ import print_function
+
+import argparse
+import collections
+import timeit
+
+from typing_inspect_lib import is_subtype
+
+from tests.helpers.build_types import build_synthetic_types
+
+
+def _all(types, targets):
+    return sum(is_subtype(type_, target) for type_ in types for target in targets)
+
+
+def _cold(types, targets):
+    is_subtype.cache_clear()
+    return _all(types, targets)
+
+
+def run(sizes=(500, 2000), targets=20, repeat=3):
+    """Return `{size: (matches, cold seconds per pair, warm seconds per pair)}`."""
+    results = collections.OrderedDict()
+    for size in sizes:
+        types = list(build_synthetic_types(size, diamonds=0.3))
+        targets_ = types[::max(1, len(types) // targets)][:targets]
+        pairs = len(types) * len(targets_)
+        matches = _cold(types, targets_)
+        results[size] = (matches,) + tuple(
+            min(timeit.repeat(lambda fn=fn: fn(types, targets_), number=1, repeat=repeat))
+            / pairs
+            for fn in (_cold, _all)
+        )
+    is_subtype.cache_clear()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 2000])
+    parser.add_argument('--targets', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    print('{0:>8} {1:>8} {2:>12} {3:>12}'.format(
+        'types', 'matches', 'cold us', 'warm us',
+    ))
+    for size, (matches, cold, warm) in run(args.sizes, args.targets).items():
+        print('{0:>8} {1:>8} {2:>12.2f} {3:>12.2f}'.format(
+            size, matches, cold * 1e6, warm * 1e6,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Measure the memory held by the records returned by the library.
+
+`TypeInfo`, `BaseObj` and `TypeVarInfo` are namedtuples, which have no
+instance dictionary and so are the same size as a plain tuple. This compares
+the records against a `__slots__` class, and against `TypeInfo`s that copy
+the arguments and parameters of the type rather than sharing them.
+
+Run with:
+
+    python -m benchmarks.bench_records
+"""
+from __future__ import print_function
+
+import collections
+import typing
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from typing_inspect_lib import get_bases, get_type_info, get_type_var_info
+from typing_inspect_lib.core.get_type_info import _TypeInfo
+
+TKey = typing.TypeVar('TKey')
+TValue = typing.TypeVar('TValue', bound=int)
+
+
+class _SlotsTypeInfo(object):  # pylint: disable=useless-object-inheritance
+    __slots__ = ('typing', 'class_', 'args', 'parameters')
+
+    def __init__(self, typing_, class_, args, parameters):
+        self.typing = typing_
+        self.class_ = class_
+        self.args = args
+        self.parameters = parameters
+
+
+def _copied(type_):
+    info = get_type_info(type_)
+    return _TypeInfo(
+        info.typing,
+        info.class_,
+        tuple(list(info.args)),
+        tuple(list(info.parameters)),
+    )
+
+
+def _slots(type_):
+    return _SlotsTypeInfo(*get_type_info(type_))
+
+
+def _measure(function, number):
+    """Average bytes allocated, and kept, per call of `function`."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = [function() for _ in range(number)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / float(len(kept))
+
+
+def build_cases():
+    """Build the records to measure, as `(name, function)`."""
+    mapping = typing.Mapping[str, int]
+    generic = typing.Mapping[TKey, TValue]
+    return [
+        ('TypeInfo (int)', lambda: get_type_info(int)),
+        ('TypeInfo (Mapping[str, int])', lambda: get_type_info(mapping)),
+        ('copied (Mapping[str, int])', lambda: _copied(mapping)),
+        ('slots (Mapping[str, int])', lambda: _slots(mapping)),
+        ('TypeInfo (Mapping[TKey, TValue])', lambda: get_type_info(generic)),
+        ('copied (Mapping[TKey, TValue])', lambda: _copied(generic)),
+        ('BaseObj', lambda: get_bases(mapping)[0]),
+        ('TypeVarInfo', lambda: get_type_var_info(TValue)),
+    ]
+
+
+def run(number=10000):
+    """Return `{name: bytes per record}`."""
+    if tracemalloc is None:
+        raise RuntimeError('tracemalloc is required to measure memory')
+    results = collections.OrderedDict()
+    for name, function in build_cases():
+        results[name] = _measure(function, number)
+    return results
+
+
+def main():
+    print('{0:<34} {1:>8}'.format('record', 'bytes'))
+    for name, size in run().items():
+        print('{0:<34} {1:>8.1f}'.format(name, size))
+
+
+if __name__ == '__main__':
+    main()
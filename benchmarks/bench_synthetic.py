@@ -0,0 +1,79 @@
+"""
+Time functions over growing synthetic corpora, to show how they scale.
+
+The types are built by `tests.helpers.build_types.build_synthetic_types`,
+with diamonds, so shared ancestors are common. Run with:
+
+    python -m benchmarks.bench_synthetic
+    python -m benchmarks.bench_synthetic --sizes 10000 100000 --arity 2
+
+Building the types isn't timed. Large corpora take a while to build.
+"""
+from __future__ import print_function
+
+import argparse
+import collections
+import timeit
+
+from typing_inspect_lib import get_mro_orig, get_type_info
+from typing_inspect_lib.extras.get_parents import get_parents
+
+from tests.helpers.build_types import build_synthetic_types
+
+FUNCTIONS = [
+    ('get_type_info', get_type_info),
+    ('get_parents', get_parents),
+    ('get_mro_orig', get_mro_orig),
+]
+
+
+def _all(function, types):
+    for type_ in types:
+        function(type_)
+
+
+def run(sizes=(1000, 10000), repeat=1, **kwargs):
+    """
+    Return `{size: {function: seconds per type}}`.
+
+    `kwargs` are passed to `build_synthetic_types`.
+    """
+    results = collections.OrderedDict()
+    for size in sizes:
+        types = list(build_synthetic_types(size, **kwargs))
+        results[size] = collections.OrderedDict(
+            (name, min(timeit.repeat(
+                lambda fn=function: _all(fn, types), number=1, repeat=repeat,
+            )) / len(types))
+            for name, function in FUNCTIONS
+        )
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--depth', type=int, default=4)
+    parser.add_argument('--fan-out', type=int, default=3)
+    parser.add_argument('--arity', type=int, default=2)
+    parser.add_argument('--diamonds', type=float, default=0.3)
+    args = parser.parse_args(argv)
+
+    results = run(
+        args.sizes,
+        depth=args.depth,
+        fan_out=args.fan_out,
+        arity=args.arity,
+        diamonds=args.diamonds,
+    )
+    print('{0:>8} '.format('types') + ' '.join(
+        '{0:>16}'.format(name + ' us') for name, _ in FUNCTIONS
+    ))
+    for size, timings in results.items():
+        print('{0:>8} '.format(size) + ' '.join(
+            '{0:>16.2f}'.format(seconds * 1e6) for seconds in timings.values()
+        ))
+
+
+if __name__ == '__main__':
+    main()
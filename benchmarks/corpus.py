@@ -0,0 +1,128 @@
+"""
+The fixed corpus of types timed by `benchmarks.suite`.
+
+Cases are named so results can be compared between interpreters. Cases that
+an interpreter doesn't have are left out, rather than renamed.
+"""
+import collections
+import typing
+
+try:
+    import typing_extensions
+except ImportError:
+    typing_extensions = None
+
+T = typing.TypeVar('T')
+TKey = typing.TypeVar('TKey', bound=typing.Hashable)
+TNumber = typing.TypeVar('TNumber', int, float)
+TOut = typing.TypeVar('TOut', covariant=True)
+
+
+class Node(typing.Generic[T]):
+    """A user generic."""
+
+
+class Tree(Node[T]):
+    """A user generic subclassing a user generic."""
+
+
+class Table(typing.Mapping[TKey, T]):
+    """A user generic subclassing a typing alias."""
+
+    def __getitem__(self, key):
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+
+class Names(typing.List[str]):
+    """A class subclassing a specialised alias."""
+
+
+def _optional(name):
+    return getattr(typing, name, None)
+
+
+def _builtins():
+    return [
+        ('int', int),
+        ('str', str),
+        ('list', list),
+        ('dict', dict),
+        ('object', object),
+    ]
+
+
+def _aliases():
+    names = [
+        'Any', 'Union', 'Optional', 'Tuple', 'Callable', 'List', 'Dict', 'Set',
+        'Iterable', 'Mapping', 'MutableMapping', 'Generator', 'Collection',
+    ]
+    return [(name, _optional(name)) for name in names if _optional(name) is not None]
+
+
+def _specialised():
+    return [
+        ('Union[int, str]', typing.Union[int, str]),
+        ('Optional[int]', typing.Optional[int]),
+        ('Tuple[int, str]', typing.Tuple[int, str]),
+        ('Callable[[int], str]', typing.Callable[[int], str]),
+        ('List[int]', typing.List[int]),
+        ('List[T]', typing.List[T]),
+        ('Dict[str, int]', typing.Dict[str, int]),
+        ('Mapping[str, List[int]]', typing.Mapping[str, typing.List[int]]),
+        ('Generator[int, str, bytes]', typing.Generator[int, str, bytes]),
+    ]
+
+
+def _generics():
+    return [
+        ('Node', Node),
+        ('Node[int]', Node[int]),
+        ('Tree[int]', Tree[int]),
+        ('Table', Table),
+        ('Table[str, int]', Table[str, int]),
+        ('Names', Names),
+    ]
+
+
+def _protocols():
+    cases = [
+        ('SupportsInt', typing.SupportsInt),
+        ('SupportsAbs[int]', typing.SupportsAbs[int]),
+    ]
+    if typing_extensions is not None:
+        protocol = getattr(typing_extensions, 'Protocol', None)
+        if protocol is not None:
+            class Closable(protocol):
+                def close(self):
+                    pass
+
+            cases.append(('Protocol', protocol))
+            cases.append(('Closable', Closable))
+    return cases
+
+
+def _type_vars():
+    return [
+        ('T', T),
+        ('TKey', TKey),
+        ('TNumber', TNumber),
+        ('TOut', TOut),
+    ]
+
+
+def build_corpus():
+    """Build the corpus, as `{category: [(name, type)]}`."""
+    return collections.OrderedDict([
+        ('builtins', _builtins()),
+        ('aliases', _aliases()),
+        ('specialised', _specialised()),
+        ('generics', _generics()),
+        ('protocols', _protocols()),
+        ('type vars', _type_vars()),
+    ])
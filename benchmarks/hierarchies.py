@@ -0,0 +1,36 @@
+"""
+Synthetic generic class hierarchies for the benchmarks.
+
+Larger, randomised, hierarchies are built by
+`tests.helpers.build_types.build_synthetic_types`.
+"""
+import typing
+
+from tests.helpers.build_types import _new_class
+
+T = typing.TypeVar('T')
+
+
+def deep(depth):
+    """Build a chain of `depth` generic classes, returning the most derived."""
+    class_ = typing.Generic
+    for index in range(depth):
+        class_ = _new_class('Deep{0}'.format(index), (class_[T],))
+    return class_
+
+
+def wide(width, depth):
+    """
+    Build `depth` levels of `width` generic classes, returning a class below them.
+
+    Every class subclasses every class in the level above it, so each
+    level is a diamond over the one above.
+    """
+    level = [typing.Generic]
+    for index in range(depth):
+        bases = tuple(base[T] for base in level)
+        level = [
+            _new_class('Wide{0}_{1}'.format(index, position), bases)
+            for position in range(width)
+        ]
+    return _new_class('Wide', tuple(base[T] for base in level))
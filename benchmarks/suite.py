@@ -0,0 +1,229 @@
+"""
+Time every public function over the fixed corpus in `benchmarks.corpus`.
+
+Results are JSON, so runs on different interpreters, or before and after a
+change, can be compared. Run with:
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --output .benchmarks
+
+or for each interpreter with tox:
+
+    tox -e bench-py37
+
+With `--output` the results are written to a file named after the
+interpreter, such as `.benchmarks/cpython-3.7.16.json`. Pass an earlier
+results file to `--compare` to list the cases that got slower, or started
+or stopped raising.
+"""
+from __future__ import print_function
+
+import argparse
+import collections
+import json
+import os
+import platform
+import sys
+import timeit
+import typing
+
+try:
+    import typing_extensions
+except ImportError:
+    typing_extensions = None
+
+from typing_inspect_lib import (
+    Matcher, canonical, fingerprint, get_args, get_bases, get_generic_args_for,
+    get_mro, get_mro_orig, get_parameters, get_type_info, get_type_info_many,
+    get_type_var_info, get_typing, get_validator, is_instance, is_subtype,
+    substitute, unify,
+)
+
+from .corpus import T, TKey, TNumber, TOut, build_corpus
+
+# The types bound to the TypeVars of the corpus, for `substitute`.
+BINDINGS = {T: int, TKey: str, TNumber: float, TOut: bytes}
+
+# The value checked against each type, for `is_instance`.
+VALUE = [{'a': 1}, {'b': 2}]
+
+MATCHER = Matcher([
+    (typing.Mapping[TKey, T], 'mapping'),
+    (typing.Iterable[T], 'iterable'),
+    (typing.Optional[int], 'optional int'),
+])
+
+
+def _iterable_args(type_):
+    return get_generic_args_for(type_, typing.Iterable)
+
+
+def _is_instance(type_):
+    return is_instance(VALUE, type_)
+
+
+def _is_subtype(type_):
+    return is_subtype(type_, typing.Iterable[typing.Any])
+
+
+def _unify(type_):
+    return unify(typing.Iterable[T], type_)
+
+
+def _substitute(type_):
+    return substitute(type_, BINDINGS)
+
+
+def _cold(function, cache_clear):
+    """Time the function on an empty cache."""
+    def cold(type_):
+        cache_clear()
+        return function(type_)
+    return cold
+
+
+# `(name, function, categories or None for all, called with a whole category)`
+FUNCTIONS = [
+    ('get_typing', get_typing, None, False),
+    ('get_args', get_args, None, False),
+    ('get_parameters', get_parameters, None, False),
+    ('get_type_info', get_type_info, None, False),
+    ('get_type_info_many', get_type_info_many, None, True),
+    ('get_type_var_info', get_type_var_info, ['type vars'], False),
+    ('get_bases', get_bases, None, False),
+    ('get_mro', get_mro, None, False),
+    ('get_mro_orig', get_mro_orig, None, False),
+    ('get_generic_args_for', _iterable_args, None, False),
+    ('get_validator', get_validator, None, False),
+    ('is_instance', _is_instance, None, False),
+    ('is_subtype', _is_subtype, None, False),
+    ('is_subtype (cold)', _cold(_is_subtype, is_subtype.cache_clear), None, False),
+    ('unify', _unify, None, False),
+    ('unify (cold)', _cold(_unify, unify.cache_clear), None, False),
+    ('Matcher.match', MATCHER.match, None, False),
+    ('Matcher.match (cold)', _cold(MATCHER.match, MATCHER.cache_clear), None, False),
+    ('substitute', _substitute, None, False),
+    ('substitute (cold)', _cold(_substitute, substitute.cache_clear), None, False),
+    ('canonical', canonical, None, False),
+    ('fingerprint', fingerprint, None, False),
+    ('fingerprint (cold)', _cold(fingerprint, fingerprint.cache_clear), None, False),
+]
+
+
+def _time(function, arg, number, repeat):
+    """Seconds per call, or the error raised when calling the function."""
+    try:
+        function(arg)
+    except Exception as error:  # pylint: disable=broad-except
+        return None, '{0}: {1}'.format(type(error).__name__, error)
+    timer = timeit.Timer(lambda: function(arg))
+    return min(timer.repeat(number=number, repeat=repeat)) / number, None
+
+
+def _interpreter():
+    return collections.OrderedDict([
+        ('implementation', platform.python_implementation().lower()),
+        ('version', platform.python_version()),
+        ('typing_extensions', typing_extensions is not None),
+        ('platform', platform.platform()),
+    ])
+
+
+def run(number=200, repeat=3):
+    """
+    Time the functions over the corpus.
+
+    Returns the interpreter, and `{function: {case: result}}`, where each case
+    is named `category/name`. Results hold the seconds per call, or the error
+    the call raised.
+    """
+    corpus = build_corpus()
+    results = collections.OrderedDict()
+    for name, function, categories, per_category in FUNCTIONS:
+        cases = collections.OrderedDict()
+        for category, types in corpus.items():
+            if categories is not None and category not in categories:
+                continue
+            if per_category:
+                args = [(category, [type_ for _, type_ in types])]
+            else:
+                args = [(category + '/' + case, type_) for case, type_ in types]
+            for case, arg in args:
+                seconds, error = _time(function, arg, number, repeat)
+                cases[case] = collections.OrderedDict([
+                    ('seconds', seconds),
+                    ('error', error),
+                ])
+        results[name] = cases
+    return collections.OrderedDict([
+        ('interpreter', _interpreter()),
+        ('number', number),
+        ('repeat', repeat),
+        ('results', results),
+    ])
+
+
+def compare(before, after, threshold=1.2):
+    """
+    Compare two results, returning `(function, case, before, after)` for changed cases.
+
+    A case has changed if its time grew by more than `threshold` times, or if
+    it started or stopped raising. Cases only in one of the results are ignored.
+    """
+    changed = []
+    for name, cases in after['results'].items():
+        before_cases = before['results'].get(name, {})
+        for case, result in cases.items():
+            before_result = before_cases.get(case)
+            if before_result is None:
+                continue
+            if (before_result['error'] is None) != (result['error'] is None):
+                changed.append((name, case, before_result, result))
+            elif (
+                result['error'] is None
+                and result['seconds'] > before_result['seconds'] * threshold
+            ):
+                changed.append((name, case, before_result, result))
+    return changed
+
+
+def _describe(result):
+    if result['error'] is not None:
+        return result['error']
+    return '{0:.2f}us'.format(result['seconds'] * 1e6)
+
+
+def _file_name(interpreter):
+    return '{0}-{1}.json'.format(interpreter['implementation'], interpreter['version'])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', help='directory to write the results to')
+    parser.add_argument('--number', type=int, default=200, help='calls per timing')
+    parser.add_argument('--repeat', type=int, default=3, help='timings per case')
+    parser.add_argument('--compare', help='earlier results to compare against')
+    args = parser.parse_args(argv)
+
+    results = run(number=args.number, repeat=args.repeat)
+    if args.compare is not None:
+        with open(args.compare) as file_:
+            before = json.load(file_)
+        for name, case, before_result, result in compare(before, results):
+            print('{0} {1}: {2} -> {3}'.format(
+                name, case, _describe(before_result), _describe(result),
+            ), file=sys.stderr)
+    output = json.dumps(results, indent=2)
+    if args.output is None:
+        print(output)
+        return
+    if not os.path.isdir(args.output):
+        os.makedirs(args.output)
+    path = os.path.join(args.output, _file_name(results['interpreter']))
+    with open(path, 'w') as file_:
+        file_.write(output + '\n')
+    print('Wrote {0}'.format(path), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
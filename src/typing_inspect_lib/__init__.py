@@ -1,22 +1,43 @@
-from .core import get_args, get_parameters, get_type_info, get_typing
+from .core import (
+    explain, get_args, get_parameters, get_type_info, get_type_info_many,
+    get_typing, stats, stats_enable, stats_reset,
+)
+from .core.helpers import VERSION
 from .core.helpers.typing_ import (
     BaseProtocol as BaseProtocol_,
     ClassVar as ClassVar_,
     NewType as NewType_,
     Protocol as Protocol_,
 )
-from .extras import get_bases, get_mro, get_mro_orig, get_type_var_info
 
 __all__ = [
     'get_args',
     'get_bases',
+    'get_generic_args_for',
     'get_type_info',
+    'get_type_info_many',
     # 'get_generic_type',
     'get_parameters',
     'get_type_var_info',
     'get_typing',
+    'get_validator',
     'get_mro',
+    'is_instance',
+    'is_subtype',
     'get_mro_orig',
+    'iter_mro_orig',
+    'iter_parents',
+    'substitute',
+    'unify',
+    'walk',
+    'canonical',
+    'fingerprint',
+    'Fold',
+    'Matcher',
+    'explain',
+    'stats',
+    'stats_enable',
+    'stats_reset',
 
     # Types returned by `get_typing` for compatibility
     'ClassVar_',
@@ -26,3 +47,46 @@ __all__ = [
     'Protocol_',
     'BaseProtocol_',
 ]
+
+# Names provided by `extras`, which is imported on first use when possible.
+_EXTRAS = [
+    'Fold',
+    'Matcher',
+    'canonical',
+    'fingerprint',
+    'get_bases',
+    'get_generic_args_for',
+    'get_mro',
+    'get_mro_orig',
+    'get_type_var_info',
+    'get_validator',
+    'is_instance',
+    'is_subtype',
+    'iter_mro_orig',
+    'iter_parents',
+    'substitute',
+    'unify',
+    'walk',
+]
+
+if VERSION < (3, 7, 0):
+    from .extras import (
+        Fold, Matcher, canonical, fingerprint, get_bases, get_generic_args_for,
+        get_mro, get_mro_orig, get_type_var_info, get_validator, is_instance,
+        is_subtype, iter_mro_orig, iter_parents, substitute, unify, walk,
+    )
+else:
+    def __getattr__(name):
+        """Import `extras` the first time one of its names is used."""
+        if name not in _EXTRAS:
+            raise AttributeError(
+                'module {0!r} has no attribute {1!r}'.format(__name__, name),
+            )
+        from . import extras
+        global_ = globals()
+        for name_ in _EXTRAS:
+            global_[name_] = getattr(extras, name_)
+        return global_[name]
+
+    def __dir__():
+        return sorted(set(globals()) | set(_EXTRAS))
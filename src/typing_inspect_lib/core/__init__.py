@@ -1,13 +1,20 @@
 __all__ = [
+    'explain',
     'get_args',
     'get_base_type',
     'get_parameters',
     'get_type_info',
+    'get_type_info_many',
     'get_typing',
+    'stats',
+    'stats_enable',
+    'stats_reset',
 ]
 
+from .explain import explain
 from .get_args import get_args
 from .get_base_type import get_base_type
 from .get_parameters import get_parameters
-from .get_type_info import get_type_info
+from .get_type_info import get_type_info, get_type_info_many
 from .get_typing import get_typing
+from .stats import stats, stats_enable, stats_reset
@@ -0,0 +1,75 @@
+import collections
+import importlib
+import timeit
+
+__all__ = [
+    'explain',
+]
+
+# `core` replaces its submodules with the functions of the same name.
+_TYPING = importlib.import_module(__name__.rsplit('.', 1)[0] + '.get_typing')
+_TIMER = timeit.default_timer
+
+_Step = collections.namedtuple('Step', ['name', 'key', 'value', 'error', 'seconds'])
+_Explanation = collections.namedtuple(
+    'Explanation',
+    ['type', 'result', 'steps', 'seconds'],
+)
+
+
+class _Trace(object):  # pylint: disable=useless-object-inheritance
+    """Record each step taken, with the time spent on it."""
+
+    def __init__(self):
+        self.steps = []
+
+    def __call__(self, name, key, function):
+        """Record the step where it starts, and any `TypeError` it raised."""
+        index = len(self.steps)
+        self.steps.append(None)
+        start = _TIMER()
+        try:
+            value = function(key)
+        except TypeError as error:
+            self.steps[index] = _Step(
+                name, key, None, type(error).__name__, _TIMER() - start,
+            )
+            raise
+        self.steps[index] = _Step(name, key, value, None, _TIMER() - start)
+        return value
+
+    def step(self, name, function):
+        """Record each call to a step of a resolver, see `_build_resolver`."""
+        def traced(key, *args):
+            return self(name, key, lambda key_: function(key_, *args))
+        return traced
+
+
+def explain(type_):
+    """
+    Explain how `get_typing` resolves the type.
+
+    Returns the type, the result, the steps taken and the seconds taken. Each
+    step has its name, the key looked up, the value found, the name of the
+    error raised by the step, which the resolver may swallow, and the seconds
+    taken. The resolver is built with each of its steps traced, so this takes
+    the same steps `get_typing` does, and skips its cache.
+
+    Example:
+
+        explain(int).steps == (
+            Step('_RESOLVERS', type, <resolver>, None, ...),
+            Step('resolver', type, ('hashable', <resolver>), None, ...),
+            Step('_KNOWN', int, (int, int), None, ...),
+        )
+    """
+    start = _TIMER()
+    trace = _Trace()
+    trace('_RESOLVERS', type(type_), _TYPING._RESOLVERS.get)
+    _, resolver = trace(
+        'resolver',
+        type(type_),
+        lambda key: _TYPING._build_resolver(key, trace.step),
+    )
+    result = resolver(type_)
+    return _Explanation(type_, result, tuple(trace.steps), _TIMER() - start)
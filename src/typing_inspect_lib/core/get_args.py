@@ -90,6 +90,33 @@ else:
         return getattr(type_, '__args__', None) or ()
 
 
+if PY_OLD:
+    def _get_branch(type_, t_typing=SENTINEL):
+        """
+        Get the name of the branch that gets the arguments, used when instrumenting.
+
+        This follows `_get_args`, and is kept next to it so they're changed together.
+        """
+        if type(type_) is typing._TypeAlias:  # pylint: disable=unidiomatic-typecheck
+            return '_TypeAlias'
+        if get_base_type(type_)[1]:
+            return 'get_base_type'
+        if t_typing is SENTINEL:
+            t_typing, _ = get_typing(type_)
+        if _handle_special_type(type_, t_typing) is not None:
+            return '_handle_special_type'
+        if _handle_origin(type_) is not None:
+            return '_handle_origin'
+        return 'None'
+else:
+    def _get_branch(type_, t_typing=SENTINEL):  # pylint: disable=unused-argument
+        if get_base_type(type_)[1]:
+            return 'get_base_type'
+        if getattr(type_, '__args__', None):
+            return '__args__'
+        return 'None'
+
+
 def get_args(type_):
     """Get the arguments stored in the type provided.
 
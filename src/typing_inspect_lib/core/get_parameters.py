@@ -1,6 +1,6 @@
 import typing
 
-from .get_args import get_args
+from .get_args import _get_args
 from .get_typing import get_typing
 from .helpers import PY_35, PY_OLD, VERSION, safe_getattr_tuple, typing_
 
@@ -18,7 +18,7 @@ if PY_35 and VERSION <= (3, 5, 2):
         if t_typing is SENTINEL:
             t_typing, _ = get_typing(type_)
         if t_typing in _USE_ARGS:
-            parameters = get_args(type_)
+            parameters = _get_args(type_, t_typing=t_typing)
         else:
             parameters = getattr(type_, '__parameters__', None) or ()
         return tuple(p for p in parameters if isinstance(p, typing.TypeVar))
@@ -27,7 +27,7 @@ elif PY_OLD:
         if t_typing is SENTINEL:
             t_typing, _ = get_typing(type_)
         if t_typing is typing_.ClassVar:
-            return get_args(type_)
+            return _get_args(type_, t_typing=t_typing)
         return safe_getattr_tuple(type_, '__parameters__')
 else:
     def _get_parameters(type_, t_typing=SENTINEL):
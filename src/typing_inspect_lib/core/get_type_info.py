@@ -2,7 +2,7 @@ import collections
 
 from .get_args import _get_args
 from .get_parameters import _get_parameters
-from .get_typing import get_typing
+from .get_typing import _CACHE, _get_resolver, get_typing
 
 
 _TypeInfo = collections.namedtuple(
@@ -25,8 +25,46 @@ def get_type_info(type_):
         type_.parameters == (TKey,)
     """
     t_typing, class_ = get_typing(type_)
+    return _get_type_info(type_, t_typing, class_)
+
+
+def _get_type_info(type_, t_typing, class_):
+    """Build the type information from the result of `get_typing`."""
     if t_typing is None and class_ is None:
         return None
-    args = tuple(a for a in _get_args(type_, t_typing=t_typing))
-    parameters = tuple(p for p in _get_parameters(type_, t_typing=t_typing))
+    # `tuple` returns tuples unchanged, so these share the type's own tuples.
+    args = tuple(_get_args(type_, t_typing=t_typing))
+    parameters = tuple(_get_parameters(type_, t_typing=t_typing))
     return _TypeInfo(t_typing, class_, args, parameters)
+
+
+def get_type_info_many(types):
+    """
+    Get all the type information for each of the types, in the order provided.
+
+    Identical types are only inspected once, and types are grouped by their
+    type so that the `get_typing` resolver is only looked up once per group.
+
+    Examples:
+
+        get_type_info_many([int, Mapping[TKey, int], int]) == (
+            get_type_info(int),
+            get_type_info(Mapping[TKey, int]),
+            get_type_info(int),
+        )
+    """
+    types = list(types)
+    groups = {}
+    seen = set()
+    for type_ in types:
+        if id(type_) not in seen:
+            seen.add(id(type_))
+            groups.setdefault(type(type_), []).append(type_)
+
+    infos = {}
+    for type_type, group in groups.items():
+        resolve = _CACHE if _CACHE.enabled else _get_resolver(type_type)
+        for type_ in group:
+            t_typing, class_ = resolve(type_)
+            infos[id(type_)] = _get_type_info(type_, t_typing, class_)
+    return tuple(infos[id(type_)] for type_ in types)
@@ -3,15 +3,21 @@ import typing
 
 from .get_origins import _get_last_origin
 from .helpers import (
-    LITERAL_TYPES, PY_OLD, TYPING_OBJECTS, get_special_wrapped,
-    safe_dict_get, safe_dict_get_both, typing_,
+    IdentityCache, LITERAL_TYPES, PY_OLD, TYPING_OBJECTS, safe_dict_get,
+    safe_dict_get_both, typing_,
 )
+from .helpers.links import SPECIAL_OBJECTS_WRAPPED, _SPECIAL_CONV
+
+
+def _untraced(name, function):  # pylint: disable=unused-argument
+    """The step used outside of `explain` and `stats`, which calls the function as is."""
+    return function
 
 
 if PY_OLD:
-    def _get_typing(type_):
+    def _build_get_typing(step):
         """
-        Returns the typing type and class type of a wrapped or unwrapped type.
+        Build the function that returns the typing and class type of a type.
 
         This function doesn't work special types, these require another function to
         extract the information correctly. Builtin {literal types, class types,
@@ -23,65 +29,245 @@ if PY_OLD:
             _get_typing(MyClass) == (MyClass, MyClass)
             _get_typing(MyClass[str, int]) == (MyClass, MyClass)
         """
-        origin = _get_last_origin(type_)
-        if origin is not None:
-            return origin, safe_dict_get(TYPING_OBJECTS.typing, origin) or origin
+        get_origin = step('_get_last_origin', _get_last_origin)
+        get_class = step('TYPING_OBJECTS.typing', TYPING_OBJECTS.typing.get)
+        is_generic = step('GenericMeta', lambda key: isinstance(key, typing.GenericMeta))
+
+        def _get_typing(type_):
+            origin = get_origin(type_)
+            if origin is not None:
+                try:
+                    class_ = get_class(origin)
+                except TypeError:
+                    class_ = None
+                return origin, class_ or origin
+
+            if is_generic(type_):
+                return type_, type_
+            return None
+        return _get_typing
 
-        if isinstance(type_, typing.GenericMeta):
-            return type_, type_
-        return None
+    def _build_special_typing(step):
+        """Build the function that handles the special types `_get_typing` can't."""
+        get_key = step(
+            '_SPECIAL_CONV',
+            lambda key: safe_dict_get(_SPECIAL_CONV, key, key),
+        )
+        get_wrapped = step(
+            'SPECIAL_OBJECTS_WRAPPED.class_',
+            lambda key: safe_dict_get_both(SPECIAL_OBJECTS_WRAPPED.class_, key, inv=True),
+        )
+
+        def _get_special_typing(type_type):
+            return get_wrapped(get_key(type_type))
+        return _get_special_typing
 else:
-    def _get_typing(type_):
-        origin = getattr(type_, '__origin__', None)
-        if origin is not None:
-            return safe_dict_get(TYPING_OBJECTS.class_, origin) or origin, origin
-
-        if hasattr(type_, '__orig_bases__'):
-            return type_, type_
-        return None
-
-
-def _get_special_typing_universal(type_):
-    """Handles the following types for wrapped types: TypeVar, Protocol, NewType"""
-    if isinstance(type_, typing.TypeVar):
-        return typing.TypeVar, type_
-    if isinstance(type_, typing_.ProtocolMeta):
-        return typing_.Protocol, type_
-    if isinstance(type_, types.FunctionType) and hasattr(type_, '__supertype__'):
+    def _build_get_typing(step):
+        get_origin = step('__origin__', lambda key: getattr(key, '__origin__', None))
+        get_typing_ = step('TYPING_OBJECTS.class_', TYPING_OBJECTS.class_.get)
+        is_generic = step('__orig_bases__', lambda key: hasattr(key, '__orig_bases__'))
+
+        def _get_typing(type_):
+            origin = get_origin(type_)
+            if origin is not None:
+                try:
+                    typing_type = get_typing_(origin)
+                except TypeError:
+                    typing_type = None
+                return typing_type or origin, origin
+
+            if is_generic(type_):
+                return type_, type_
+            return None
+        return _get_typing
+
+    def _build_special_typing(step):  # pylint: disable=unused-argument
+        return lambda type_type: None
+
+
+_get_typing = _build_get_typing(_untraced)
+_get_special_typing = _build_special_typing(_untraced)
+
+
+def _resolve_type_var(type_):
+    return typing.TypeVar, type_
+
+
+def _resolve_protocol(type_):
+    return typing_.Protocol, type_
+
+
+def _finalise(type_, ret):
+    """Convert the result of a lookup into the value returned by `get_typing`."""
+    if ret is None:
+        return None, None
+    if ret[0] is typing_.NewType:
         return typing_.NewType, type_
-    return None
+    return ret
 
 
-if PY_OLD:
-    def _get_special_typing(type_):
-        """Handles special types that can't be handled through normal means."""
-        return get_special_wrapped(type_)
-else:
-    def _get_special_typing(type_):
-        return None
+# The lookups merged into `_KNOWN`, from lowest to highest priority.
+_KNOWN_LOOKUPS = [
+    (
+        'TYPING_OBJECTS.typing',
+        TYPING_OBJECTS.typing,
+        lambda key: safe_dict_get_both(TYPING_OBJECTS.typing, key),
+    ),
+    (
+        'TYPING_OBJECTS.class_',
+        TYPING_OBJECTS.class_,
+        lambda key: safe_dict_get_both(TYPING_OBJECTS.class_, key, inv=True),
+    ),
+    ('LITERAL_TYPES', LITERAL_TYPES, lambda key: safe_dict_get(LITERAL_TYPES, key)),
+]
+
+
+def _build_known():
+    """
+    Merge the literal, class type and typing type lookups into one dictionary.
+
+    Lookups are added from lowest to highest priority, so that when an object is
+    in more than one lookup the highest priority result is kept. The name of the
+    lookup each result came from is returned alongside.
+    """
+    known = {}
+    sources = {}
+    for name, mapping, get in _KNOWN_LOOKUPS:
+        for key in list(mapping):
+            ret = get(key)
+            if ret is not None:
+                known[key] = _finalise(key, ret)
+                sources[key] = name
+    return known, sources
+
+
+_KNOWN, _KNOWN_SOURCES = _build_known()
+
+
+def _build_function_resolver(step, special):
+    """Build a resolver for functions, which may be `NewType`s."""
+    is_new_type = step('__supertype__', lambda key: hasattr(key, '__supertype__'))
+    get_known = step('_KNOWN', _KNOWN.get)
+    get_typing_ = step('_get_typing', _build_get_typing(step))
+    get_special = step('_get_special_typing', lambda key: special)
+    finalise = step('_finalise', _finalise)
+
+    def resolve(type_):
+        if is_new_type(type_):
+            return typing_.NewType, type_
+        ret = get_known(type_)
+        if ret is not None:
+            return ret
+        return finalise(type_, get_typing_(type_) or get_special(type_))
+    return resolve
+
+
+def _build_unhashable_resolver(step, special):
+    """Build a resolver for unhashable objects, which can't be in any lookup."""
+    get_typing_ = step('_get_typing', _build_get_typing(step))
+    get_special = step('_get_special_typing', lambda key: special)
+    finalise = step('_finalise', _finalise)
+
+    def resolve(type_):
+        return finalise(type_, get_typing_(type_) or get_special(type_))
+    return resolve
+
+
+def _build_hashable_resolver(step, special):
+    """Build a resolver for objects that may be in a lookup."""
+    get_known = step('_KNOWN', _KNOWN.get)
+    get_typing_ = step('_get_typing', _build_get_typing(step))
+    get_special = step('_get_special_typing', lambda key: special)
+    finalise = step('_finalise', _finalise)
+
+    def resolve(type_):
+        try:
+            ret = get_known(type_)
+        except TypeError:
+            ret = None
+        if ret is not None:
+            return ret
+        return finalise(type_, get_typing_(type_) or get_special(type_))
+    return resolve
+
+
+def _build_resolver(type_type, step=_untraced):
+    """
+    Build the function that gets the typing and class type of `type_type` instances.
+
+    Returns the kind of resolver and the resolver. Each step the resolver takes is
+    passed through `step(name, function)` when it's built, and the function
+    returned is called in its place. `explain` and `stats` follow the steps with
+    this, and so can't drift from what the resolver does.
+    """
+    if issubclass(type_type, typing.TypeVar):
+        return 'TypeVar', step('TypeVar', _resolve_type_var)
+    if issubclass(type_type, typing_.ProtocolMeta):
+        return 'Protocol', step('Protocol', _resolve_protocol)
+    special = _build_special_typing(step)(type_type)
+    if issubclass(type_type, types.FunctionType):
+        return 'function', _build_function_resolver(step, special)
+    if type_type.__hash__ is None:
+        return 'unhashable', _build_unhashable_resolver(step, special)
+    return 'hashable', _build_hashable_resolver(step, special)
+
+
+_RESOLVERS = {}
+# Wraps new resolvers whilst `stats` is instrumenting `get_typing`.
+_instrument_resolver = None
+
+
+def _get_resolver(type_type):
+    """Get the resolver for `type_type` instances, building it on first use."""
+    resolver = _RESOLVERS.get(type_type)
+    if resolver is None:
+        _, resolver = _build_resolver(type_type)
+        if _instrument_resolver is not None:
+            resolver = _instrument_resolver(type_type, resolver)
+        _RESOLVERS[type_type] = resolver
+    return resolver
+
+
+for _type_type in (
+    [typing.TypeVar, typing_.ProtocolMeta, types.FunctionType, type]
+    + [type(key) for key in _KNOWN]
+    + [key for key in _SPECIAL_CONV if isinstance(key, type)]
+):
+    _get_resolver(_type_type)
+
+
+def _get_typing_all(type_):
+    """Get the typing and class type via the resolver for the type of the type."""
+    resolver = _RESOLVERS.get(type(type_))
+    if resolver is None:
+        resolver = _get_resolver(type(type_))
+    return resolver(type_)
+
+
+_CACHE = IdentityCache(_get_typing_all)
 
 
 def get_typing(type_):
     """
     Gets the typing type and the class type of the type passed to it.
 
+    Results can be cached by the identity of the type passed, see
+    `get_typing.cache_enable`, `get_typing.cache_info` and `get_typing.cache_clear`.
+
     Examples:
 
         get_typing(Mapping) == (Mapping, collections.abc.Mapping)
         get_typing(Mapping[str, int]) == (Mapping, collections.abc.Mapping)
         get_typing(Union[str, int]) == (Union, Union)
     """
-    ret = (
-        _get_special_typing_universal(type_)
-        or safe_dict_get(LITERAL_TYPES, type_)
-        or safe_dict_get_both(TYPING_OBJECTS.class_, type_, inv=True)
-        or safe_dict_get_both(TYPING_OBJECTS.typing, type_)
-        or _get_typing(type_)
-        or _get_special_typing(type_)
-    )
-    if ret is None:
-        return None, None
-    type_type, class_type = ret
-    if type_type is typing_.NewType:
-        class_type = type_
-    return type_type, class_type
+    if _CACHE.enabled:
+        return _CACHE(type_)
+    resolver = _RESOLVERS.get(type(type_))
+    if resolver is None:
+        resolver = _get_resolver(type(type_))
+    return resolver(type_)
+
+
+get_typing.cache_enable = _CACHE.cache_enable
+get_typing.cache_info = _CACHE.cache_info
+get_typing.cache_clear = _CACHE.cache_clear
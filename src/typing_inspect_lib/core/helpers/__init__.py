@@ -3,13 +3,14 @@ from __future__ import absolute_import
 from . import abc
 from . import re
 from . import typing_
+from .cache import CacheInfo, IdentityCache, IdentityKeysCache
 from .helpers import (
     PY350_2, PY_35, PY_OLD, VERSION, pairwise, safe_dict_contains,
     safe_dict_get, safe_dict_get_both, safe_getattr_tuple,
 )
 from .links import (
-    LITERAL_TYPES, TYPING_OBJECTS, get_special_wrapped, is_special,
-    is_typing,
+    LITERAL_TYPES, TYPING_OBJECTS, get_special_wrapped, get_special_wrapped_type,
+    is_special, is_typing,
 )
 
 __all__ = [
@@ -30,4 +31,8 @@ __all__ = [
     'is_typing',
     'is_special',
     'get_special_wrapped',
+    'get_special_wrapped_type',
+    'CacheInfo',
+    'IdentityCache',
+    'IdentityKeysCache',
 ]
@@ -0,0 +1,161 @@
+"""
+Generate the links for the running version of Python.
+
+The generated module holds the resolved contents of `links.json`, so that
+importing `links` doesn't need to read or parse it. Run it with the
+interpreter, and `typing_extensions`, that the library will be used with:
+
+    python -m typing_inspect_lib.core.helpers.build_links
+
+The generated module is ignored if `typing_extensions` is installed or
+removed afterwards, and should be rebuilt whenever `links.json` changes.
+"""
+from __future__ import absolute_import, print_function
+
+import importlib
+import os.path
+import sys
+import typing
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+try:
+    import typing_extensions
+except ImportError:
+    typing_extensions = None
+
+from . import abc
+from . import links
+from . import re
+from . import typing_
+
+__all__ = [
+    'build',
+    'main',
+]
+
+_HELPERS = [
+    ('abc', abc),
+    ('re', re),
+    ('typing_', typing_),
+]
+
+
+class _Names(object):  # pylint: disable=useless-object-inheritance
+    """Find Python expressions that evaluate to objects, and the imports they need."""
+
+    def __init__(self):
+        self.imports = set()
+        self._names = {id(type(None)): (None, 'type(None)')}
+        for name, module in _HELPERS:
+            self._add_module(module, None, name)
+        for attr, value in vars(builtins).items():
+            self._add(value, None, attr)
+        for module in (typing, typing_extensions):
+            if module is not None:
+                self._add_module(module, module.__name__, module.__name__)
+
+    def _add_module(self, module, import_, name):
+        for attr, value in vars(module).items():
+            if not attr.startswith('_'):
+                self._add(value, import_, name + '.' + attr)
+
+    def _add(self, value, module, name):
+        self._names.setdefault(id(value), (module, name))
+
+    @staticmethod
+    def _from_qualname(value):
+        module_name = getattr(value, '__module__', None)
+        qualname = getattr(value, '__qualname__', getattr(value, '__name__', None))
+        if module_name is None or qualname is None:
+            return None
+        if module_name.split('.')[0] in dict(_HELPERS):
+            # These names are used by the helper modules in the generated module.
+            return None
+        try:
+            obj = importlib.import_module(module_name)
+            for attr in qualname.split('.'):
+                obj = getattr(obj, attr)
+        except (AttributeError, ImportError):
+            return None
+        if obj is not value:
+            return None
+        return module_name, module_name + '.' + qualname
+
+    def __call__(self, value):
+        found = self._names.get(id(value)) or self._from_qualname(value)
+        if found is None:
+            raise ValueError('No importable name for {0!r}'.format(value))
+        module, name = found
+        if module is not None:
+            self.imports.add(module)
+        return name
+
+
+def _dict(name, items, indent=''):
+    lines = ['{0}{1}{{'.format(indent, name)]
+    lines += ['{0}    {1}: {2},'.format(indent, key, value) for key, value in items]
+    lines.append(indent + '}')
+    return lines
+
+
+def _types(names, title, types):
+    lines = ['{0} = ('.format(title)]
+    for mapping in (types.typing, types.class_):
+        lines += _dict('', ((names(k), names(v)) for k, v in mapping.items()), '    ')
+        lines[-1] += ','
+    lines.append(')')
+    return lines
+
+
+def build():
+    """Build the source of the links module for the running version of Python."""
+    literal_types, typing_objects, special_objects, special_objects_wrapped = (
+        links.read_links()
+    )
+    names = _Names()
+    body = _dict(
+        'LITERAL_TYPES = ',
+        (
+            (names(key), '({0}, {1})'.format(names(value[0]), names(value[1])))
+            for key, value in literal_types.items()
+        ),
+    )
+    body += _types(names, 'TYPING_OBJECTS', typing_objects)
+    body += _types(names, 'SPECIAL_OBJECTS', special_objects)
+    body += _types(names, 'SPECIAL_OBJECTS_WRAPPED', special_objects_wrapped)
+
+    lines = [
+        '# Generated by `python -m typing_inspect_lib.core.helpers.build_links`.',
+        '# Python {0}, do not edit.'.format(sys.version.split()[0]),
+        '# flake8: noqa',
+        '# pylint: skip-file',
+        'from __future__ import absolute_import',
+        '',
+    ]
+    lines += ['import {0}'.format(module) for module in sorted(names.imports)]
+    lines += [
+        '',
+        'from . import abc',
+        'from . import re',
+        'from . import typing_',
+        '',
+        'HAS_TE = {0}'.format(typing_extensions is not None),
+        '',
+    ]
+    return '\n'.join(lines + body) + '\n'
+
+
+def main():
+    """Write the links module for the running version of Python next to `links.py`."""
+    path = os.path.join(os.path.dirname(links.__file__), links.GENERATED_NAME + '.py')
+    with open(path, 'w') as file_:
+        file_.write(build())
+    print('Wrote {0}'.format(path))
+
+
+if __name__ == '__main__':
+    main()
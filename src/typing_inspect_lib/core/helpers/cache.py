@@ -0,0 +1,179 @@
+import collections
+import weakref
+
+__all__ = [
+    'CacheInfo',
+    'IdentityCache',
+    'IdentityKeysCache',
+]
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo',
+    ['hits', 'misses', 'maxsize', 'currsize'],
+)
+
+# Stored in place of the key in cached values, so the cache doesn't keep the key alive.
+_SELF = object()
+
+
+def _pack(key, value):
+    if type(value) is tuple:  # pylint: disable=unidiomatic-typecheck
+        return tuple(_SELF if v is key else v for v in value)
+    return value
+
+
+def _unpack(key, value):
+    if type(value) is tuple:  # pylint: disable=unidiomatic-typecheck
+        return tuple(key if v is _SELF else v for v in value)
+    return value
+
+
+class _Key(object):  # pylint: disable=useless-object-inheritance
+    """Stored in place of a key in cached values, by its index in the keys."""
+
+    __slots__ = ('index',)
+
+    def __init__(self, index):
+        self.index = index
+
+
+def _pack_keys(keys, value):
+    if type(value) is not tuple:  # pylint: disable=unidiomatic-typecheck
+        return value
+    indexes = {id(key): index for index, key in enumerate(keys)}
+    return tuple(
+        _Key(indexes[id(v)]) if id(v) in indexes else v
+        for v in value
+    )
+
+
+def _unpack_keys(keys, value):
+    if type(value) is not tuple:  # pylint: disable=unidiomatic-typecheck
+        return value
+    return tuple(
+        keys[v.index] if type(v) is _Key else v  # pylint: disable=unidiomatic-typecheck
+        for v in value
+    )
+
+
+class IdentityCache(object):  # pylint: disable=useless-object-inheritance
+    """
+    Cache the results of a single argument function by the identity of the argument.
+
+    Keys are held by weak references, and entries are removed when the key is
+    collected. Keys that can't be weakly referenced are passed through uncached.
+    Tuple results have any references to the key swapped out whilst cached.
+    Results that reference the key in other ways keep it alive, so `maxsize`
+    bounds the cache to the most recently used entries.
+
+    The cache is disabled by default.
+    """
+
+    def __init__(self, function, maxsize=None):
+        self._function = function
+        self._maxsize = maxsize
+        self._cache = {} if maxsize is None else collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self.enabled = False
+
+    def __call__(self, key):
+        entry = self._cache.get(id(key))
+        if entry is not None and entry[0]() is key:
+            self._hits += 1
+            if self._maxsize is not None:
+                # Move the entry to the end, as the most recently used.
+                self._cache[id(key)] = self._cache.pop(id(key))
+            return _unpack(key, entry[1])
+
+        self._misses += 1
+        value = self._function(key)
+        self.set(key, value)
+        return value
+
+    def get(self, key, default=None):
+        """Get the cached value of the key, without calling the function."""
+        entry = self._cache.get(id(key))
+        if entry is not None and entry[0]() is key:
+            self._hits += 1
+            if self._maxsize is not None:
+                self._cache[id(key)] = self._cache.pop(id(key))
+            return _unpack(key, entry[1])
+        self._misses += 1
+        return default
+
+    def set(self, key, value):
+        """Cache the value of the key, unless the key can't be weakly referenced."""
+        key_id = id(key)
+        try:
+            ref = weakref.ref(key, lambda _: self._cache.pop(key_id, None))
+        except TypeError:
+            return
+        self._cache.pop(key_id, None)
+        self._cache[key_id] = (ref, _pack(key, value))
+        if self._maxsize is not None and len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+    def cache_info(self):
+        """Report cache statistics."""
+        return CacheInfo(self._hits, self._misses, self._maxsize, len(self._cache))
+
+    def cache_clear(self):
+        """Clear the cache and cache statistics."""
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def cache_enable(self, enabled=True):
+        """Enable, or disable, the cache. Disabling the cache clears it."""
+        self.enabled = enabled
+        if not enabled:
+            self.cache_clear()
+
+
+class IdentityKeysCache(object):  # pylint: disable=useless-object-inheritance
+    """
+    Cache values by the identities of several keys, such as the two types of a check.
+
+    Keys are held by weak references, and entries are removed when any of
+    their keys is collected. Entries with keys that can't be weakly referenced
+    aren't cached. Tuple values have any references to the keys swapped out
+    whilst cached.
+    """
+
+    def __init__(self):
+        self._cache = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, keys, default=None):
+        """Get the cached value of the keys."""
+        entry = self._cache.get(tuple([id(key) for key in keys]))
+        if entry is not None and all(ref() is key for ref, key in zip(entry[0], keys)):
+            self._hits += 1
+            return _unpack_keys(keys, entry[1])
+        self._misses += 1
+        return default
+
+    def set(self, keys, value):
+        """Cache the value of the keys, unless a key can't be weakly referenced."""
+        key_ids = tuple([id(key) for key in keys])
+
+        def remove(_):
+            self._cache.pop(key_ids, None)
+
+        try:
+            refs = tuple([weakref.ref(key, remove) for key in keys])
+        except TypeError:
+            return
+        self._cache[key_ids] = (refs, _pack_keys(keys, value))
+
+    def cache_info(self):
+        """Report cache statistics."""
+        return CacheInfo(self._hits, self._misses, None, len(self._cache))
+
+    def cache_clear(self):
+        """Clear the cache and cache statistics."""
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
@@ -1,5 +1,5 @@
 import collections
-import json
+import importlib
 import operator
 import os.path
 import typing
@@ -7,7 +7,9 @@ import typing
 try:
     import typing_extensions  # noqa: F401 This is used by _read_globals
 except ImportError:
-    pass
+    _HAS_TE = False
+else:
+    _HAS_TE = True
 
 from . import abc
 from . import re
@@ -20,13 +22,13 @@ __all__ = [
     'is_typing',
     'is_special',
     'get_special_wrapped',
+    'get_special_wrapped_type',
 ]
 
 _SENTINEL = object()
 
 _FILE_DIR = os.path.dirname(__file__)
-with open(os.path.join(_FILE_DIR, 'links.json')) as f:
-    _LINKS = json.load(f)
+GENERATED_NAME = '_links_{0}_{1}_{2}'.format(*VERSION)
 
 
 if PY_OLD:
@@ -76,6 +78,14 @@ class Types(object):  # pylint: disable=useless-object-inheritance, too-few-publ
         self.class_to_typing = self.class_
         self.typing_to_class = self.typing
 
+    @classmethod
+    def from_dicts(cls, typing_to_class, class_to_typing):
+        """Build from resolved typing to class, and class to typing, dictionaries."""
+        self = cls(())
+        self.typing._values = typing_to_class
+        self.class_._values = class_to_typing
+        return self
+
 
 def _literal_to_link_types(literals):
     return {l: (l, l) for l in literals}
@@ -96,25 +106,6 @@ def _read_globals(global_attrs):
     return values
 
 
-LITERAL_TYPES = _literal_to_link_types(
-    [
-        str,
-        int,
-        bytes,
-        type(None),
-    ]
-    + (
-        [unicode]  # noqa: F821, pylint: disable=undefined-variable
-        if VERSION < (3, 0, 0) else
-        []
-    )
-    + _read_globals(_LINKS['literal']),
-)
-
-TYPING_OBJECTS = Types(_read_globals(_LINKS['typing']))
-SPECIAL_OBJECTS = Types(_read_globals(_LINKS['special']))
-SPECIAL_OBJECTS_WRAPPED = Types(_read_globals(_LINKS['special wrapped']))
-
 # Edge cases
 _CHANGES = [
     (typing.Pattern, re.Pattern),
@@ -130,10 +121,70 @@ _CHANGES = [
     (typing.MutableSequence, abc.MutableSequence),
     (typing.MutableSet, abc.MutableSet),
 ]
-for from_, to in _CHANGES:
-    for mapping in (TYPING_OBJECTS, SPECIAL_OBJECTS, SPECIAL_OBJECTS_WRAPPED):
-        if from_ in mapping.typing:
-            mapping.typing[from_] = to
+
+
+def read_links():
+    """
+    Build the links from `links.json`.
+
+    Returns the literal types, and the typing, special and special wrapped types.
+    """
+    import json  # Only needed when the links haven't been generated.
+    with open(os.path.join(_FILE_DIR, 'links.json')) as file_:
+        links = json.load(file_)
+
+    literal_types = _literal_to_link_types(
+        [
+            str,
+            int,
+            bytes,
+            type(None),
+        ]
+        + (
+            [unicode]  # noqa: F821, pylint: disable=undefined-variable
+            if VERSION < (3, 0, 0) else
+            []
+        )
+        + _read_globals(links['literal']),
+    )
+
+    typing_objects = Types(_read_globals(links['typing']))
+    special_objects = Types(_read_globals(links['special']))
+    special_objects_wrapped = Types(_read_globals(links['special wrapped']))
+
+    for from_, to in _CHANGES:
+        for mapping in (typing_objects, special_objects, special_objects_wrapped):
+            if from_ in mapping.typing:
+                mapping.typing[from_] = to
+
+    return literal_types, typing_objects, special_objects, special_objects_wrapped
+
+
+def _load_links():
+    """
+    Load the links generated for this version of Python by `build_links`.
+
+    Falls back to building them from `links.json` if they haven't been
+    generated, or were generated with a different `typing_extensions`.
+    """
+    try:
+        generated = importlib.import_module(
+            '.' + GENERATED_NAME,
+            __name__.rpartition('.')[0],
+        )
+    except (AttributeError, ImportError):
+        generated = None
+    if generated is None or generated.HAS_TE is not _HAS_TE:
+        return read_links()
+    return (
+        generated.LITERAL_TYPES,
+        Types.from_dicts(*generated.TYPING_OBJECTS),
+        Types.from_dicts(*generated.SPECIAL_OBJECTS),
+        Types.from_dicts(*generated.SPECIAL_OBJECTS_WRAPPED),
+    )
+
+
+LITERAL_TYPES, TYPING_OBJECTS, SPECIAL_OBJECTS, SPECIAL_OBJECTS_WRAPPED = _load_links()
 
 
 _SPECIAL_CONV = {
@@ -150,11 +201,15 @@ _SPECIAL_CONV = {
 }
 
 
-def get_special_wrapped(type_):
-    key = safe_dict_get(_SPECIAL_CONV, type(type_), type(type_))
+def get_special_wrapped_type(type_type):
+    key = safe_dict_get(_SPECIAL_CONV, type_type, type_type)
     return safe_dict_get_both(SPECIAL_OBJECTS_WRAPPED.class_, key, inv=True)
 
 
+def get_special_wrapped(type_):
+    return get_special_wrapped_type(type(type_))
+
+
 def is_typing(type_):
     return type_ in TYPING_OBJECTS.typing or type_ in TYPING_OBJECTS.class_
 
@@ -0,0 +1,179 @@
+import importlib
+import timeit
+
+__all__ = [
+    'stats',
+    'stats_enable',
+    'stats_reset',
+]
+
+
+def _module(name):
+    # `core` replaces its submodules with the functions of the same name.
+    return importlib.import_module(__name__.rsplit('.', 1)[0] + '.' + name)
+
+
+_TYPING = _module('get_typing')
+# The modules that call `_get_args`, the first is where it's defined.
+_ARGS_MODULES = [
+    _module(name)
+    for name in ('get_args', 'get_parameters', 'get_type_info')
+]
+
+
+class _Stats(object):  # pylint: disable=useless-object-inheritance
+    """Counts and times of each branch of the instrumented functions."""
+
+    def __init__(self):
+        self.enabled = False
+        self.paused = False
+        self._branches = {}
+
+    def record(self, function, branch, seconds):
+        key = function, branch
+        entry = self._branches.get(key)
+        if entry is None:
+            self._branches[key] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    def branch(self, get_branch, *args):
+        """Get the branch, without recording the calls made to find it."""
+        self.paused = True
+        try:
+            return get_branch(*args)
+        finally:
+            self.paused = False
+
+    def snapshot(self):
+        functions = {}
+        for (function, branch), (calls, seconds) in list(self._branches.items()):
+            entry = functions.setdefault(
+                function,
+                {'calls': 0, 'seconds': 0.0, 'branches': {}},
+            )
+            entry['calls'] += calls
+            entry['seconds'] += seconds
+            entry['branches'][branch] = {'calls': calls, 'seconds': seconds}
+        return functions
+
+    def reset(self):
+        self._branches.clear()
+
+
+_STATS = _Stats()
+_TIMER = timeit.default_timer
+
+
+# The steps of a `get_typing` resolver that decide its branch, when they find a value.
+_BRANCHES = {
+    'TypeVar': 'TypeVar',
+    'Protocol': 'Protocol',
+    '__supertype__': 'NewType',
+    '_get_typing': '_get_typing',
+    '_get_special_typing': '_get_special_typing',
+}
+# The branches decided by the resolvers being called, innermost last.
+_DECIDED = []
+
+
+def _decide(name, function):
+    """Record the branch decided by a step of a resolver, see `_build_resolver`."""
+    if name == '_KNOWN':
+        def get_known(key):
+            ret = function(key)
+            if ret is not None:
+                _DECIDED.append(_TYPING._KNOWN_SOURCES[key])
+            return ret
+        return get_known
+    branch = _BRANCHES.get(name)
+    if branch is None:
+        return function
+
+    def decide(*args):
+        ret = function(*args)
+        if ret:
+            _DECIDED.append(branch)
+        return ret
+    return decide
+
+
+def _instrument_resolver(type_type, resolver):
+    """Build a `get_typing` resolver that records its calls, wrapping the original."""
+    _, instrumented = _TYPING._build_resolver(type_type, _decide)
+
+    def resolve(type_):
+        if _STATS.paused:
+            return resolver(type_)
+        mark = len(_DECIDED)
+        start = _TIMER()
+        try:
+            ret = instrumented(type_)
+            seconds = _TIMER() - start
+            branch = _DECIDED[mark] if len(_DECIDED) > mark else 'None'
+        finally:
+            del _DECIDED[mark:]
+        _STATS.record('get_typing', branch, seconds)
+        return ret
+    resolve.resolver = resolver
+    return resolve
+
+
+def _instrument_get_args(get_args):
+    """Wrap `_get_args` so calls are recorded."""
+    def _get_args(type_, t_typing=_ARGS_MODULES[0].SENTINEL):
+        if _STATS.paused:
+            return get_args(type_, t_typing)
+        start = _TIMER()
+        ret = get_args(type_, t_typing)
+        seconds = _TIMER() - start
+        branch = _STATS.branch(_ARGS_MODULES[0]._get_branch, type_, t_typing)
+        _STATS.record('get_args', branch, seconds)
+        return ret
+    _get_args.get_args = get_args
+    return _get_args
+
+
+def _instrument(enabled):
+    """Swap the resolvers and `_get_args` for instrumented, or the original, versions."""
+    resolvers = _TYPING._RESOLVERS
+    for type_type, resolver in list(resolvers.items()):
+        resolver = getattr(resolver, 'resolver', resolver)
+        if enabled:
+            resolver = _instrument_resolver(type_type, resolver)
+        resolvers[type_type] = resolver
+    _TYPING._instrument_resolver = _instrument_resolver if enabled else None
+
+    for module in _ARGS_MODULES:
+        get_args = getattr(module._get_args, 'get_args', module._get_args)
+        module._get_args = _instrument_get_args(get_args) if enabled else get_args
+
+
+def stats_enable(enabled=True):
+    """
+    Enable, or disable, recording the branches taken by `get_typing` and `get_args`.
+
+    Nothing is recorded, or checked, whilst disabled. Disabling keeps the
+    recorded stats, see `stats_reset`.
+    """
+    if enabled != _STATS.enabled:
+        _instrument(enabled)
+        _STATS.enabled = enabled
+
+
+def stats():
+    """
+    Get a snapshot of the recorded stats.
+
+    Returns `{function: {'calls', 'seconds', 'branches'}}`, with the branches as
+    `{branch: {'calls', 'seconds'}}`.
+    Times include the time spent in any nested calls, such as `get_typing`
+    called from `get_args`.
+    """
+    return _STATS.snapshot()
+
+
+def stats_reset():
+    """Clear the recorded stats."""
+    _STATS.reset()
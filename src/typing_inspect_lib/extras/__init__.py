@@ -1,11 +1,36 @@
 __all__ = [
+    'Fold',
+    'Matcher',
+    'canonical',
+    'fingerprint',
     'get_bases',
+    'get_generic_args_for',
     'get_type_var_info',
+    'get_validator',
+    'is_instance',
+    'is_subtype',
+    'substitute',
+    'unify',
     'get_mro',
     'get_mro_orig',
+    'iter_mro_orig',
+    'iter_parents',
+    'walk',
 ]
 
+from .canonical import canonical
+from .fingerprint import fingerprint
+from .fold import Fold
 from .get_bases import get_bases
+from .get_generic_args_for import get_generic_args_for
 from .get_mro import get_mro
-from .get_mro_orig import get_mro_orig
+from .get_mro_orig import get_mro_orig, iter_mro_orig
+from .get_parents import iter_parents
 from .get_type_var_info import get_type_var_info
+from .get_validator import get_validator
+from .is_instance import is_instance
+from .is_subtype import is_subtype
+from .matcher import Matcher
+from .substitute import substitute
+from .unify import unify
+from .walk import walk
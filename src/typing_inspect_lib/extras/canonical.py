@@ -0,0 +1,79 @@
+import typing
+import weakref
+
+from .substitute import _rebuild
+from ..core import get_type_info
+from ..core.helpers import IdentityCache
+
+# `{(id(typing type), id(canonical arg), ...): representative}`. Representatives
+# hold their arguments, so the ids aren't reused whilst they're alive.
+_TABLE = weakref.WeakValueDictionary()
+
+
+def _union_args(args):
+    """Flatten, deduplicate and order the members of a union."""
+    members = []
+    for arg in args:
+        type_info = get_type_info(arg)
+        if type_info is not None and type_info.typing is typing.Union and type_info.args:
+            members.extend(type_info.args)
+        else:
+            members.append(arg)
+    unique = {}
+    for member in members:
+        unique.setdefault(id(member), member)
+    return tuple(sorted(unique.values(), key=repr))
+
+
+def _canonical(type_):
+    type_info = get_type_info(type_)
+    if type_info is None or not type_info.args:
+        return (type_,)
+    args = tuple(canonical(arg) for arg in type_info.args)
+    if type_info.typing is typing.Union:
+        args = _union_args(args)
+    key = (id(type_info.typing),) + tuple(id(arg) for arg in args)
+    representative = _TABLE.get(key)
+    if representative is None:
+        representative = type_
+        if any(new is not old for new, old in zip(args, type_info.args)):
+            try:
+                rebuilt = _rebuild(type_info, args)
+            except TypeError:
+                rebuilt = None
+            if rebuilt == type_:
+                representative = rebuilt
+        try:
+            _TABLE[key] = representative
+        except TypeError:
+            pass
+    elif representative != type_:
+        # Some arguments aren't found before 3.7, so equal keys aren't enough.
+        representative = type_
+    # Cached in a tuple, so the cache doesn't hold types that are their own
+    # representative.
+    return (representative,)
+
+
+_CACHE = IdentityCache(_canonical)
+
+
+def canonical(type_):
+    """
+    Get the representative of the types equal to the type.
+
+    Equal types, such as `List[int]` built in two modules, get the same
+    representative, so caches keyed by identity hit for either. Unions are
+    flattened, deduplicated and ordered, so `Union[int, str]` and
+    `Union[str, int]` have the same representative. Classes, TypeVars and
+    other types without arguments are their own representative.
+
+    Representatives are held by weak references, and so are the types they're
+    looked up for.
+
+    Example:
+
+        canonical(List[int]) is canonical(List[T][int])
+        canonical(Union[int, str]) is canonical(Union[str, int])
+    """
+    return _CACHE(type_)[0]
@@ -0,0 +1,99 @@
+import hashlib
+import typing
+
+from .get_type_var_info import get_type_var_info
+from ..core import get_type_info
+from ..core.helpers import IdentityCache
+
+# Values whose reprs are the same in every process, such as forward references.
+_LITERALS = (bool, bytes, float, int, str, type(None))
+
+# Modules whose objects have reprs that are the same in every process.
+_STABLE_MODULES = ('typing', 'typing_extensions')
+
+
+def _name(obj):
+    """Get the module qualified name of a class, or the repr of a typing type."""
+    if isinstance(obj, type):
+        return '{0}.{1}'.format(
+            obj.__module__,
+            getattr(obj, '__qualname__', None) or obj.__name__,
+        )
+    if isinstance(obj, _LITERALS) or getattr(obj, '__module__', None) in _STABLE_MODULES:
+        return repr(obj)
+    raise TypeError("Can't fingerprint {0!r}, its repr can change".format(obj))
+
+
+def _arg(arg):
+    """Fingerprint an argument, which can be `...` or `()` as well as a type."""
+    if arg is Ellipsis:
+        return '...'
+    if isinstance(arg, tuple):
+        return '({0})'.format(','.join(_arg(item) for item in arg))
+    return fingerprint(arg)
+
+
+def _parts(type_):
+    if isinstance(type_, typing.TypeVar):
+        info = get_type_var_info(type_)
+        return [
+            'TypeVar',
+            info.name,
+            str(info.covariant),
+            str(info.contravariant),
+            '' if info.bound is None else fingerprint(info.bound),
+        ] + [fingerprint(constraint) for constraint in info.constraints]
+    supertype = getattr(type_, '__supertype__', None)
+    if supertype is not None:
+        if type_.__module__ == 'typing':
+            # NewTypes are functions defined in `typing` before 3.10.
+            raise TypeError(
+                "Can't fingerprint {0!r}, its module isn't known".format(type_),
+            )
+        return ['NewType', type_.__module__, type_.__name__, fingerprint(supertype)]
+    type_info = get_type_info(type_)
+    if type_info is None:
+        return [_name(type_)]
+    args = [_arg(arg) for arg in type_info.args]
+    if type_info.typing is typing.Union:
+        # Equal unions can have their members in any order.
+        args.sort()
+    return [_name(type_info.typing), _name(type_info.class_)] + args
+
+
+def _fingerprint(type_):
+    return hashlib.sha256('\0'.join(_parts(type_)).encode('utf-8')).hexdigest()
+
+
+_CACHE = IdentityCache(_fingerprint)
+
+
+def fingerprint(type_):
+    """
+    Get a digest of the type, which is the same in every process.
+
+    The digest is built from the module qualified names of the typing type
+    and class, see `get_typing`, and the fingerprints of the arguments. Union
+    members are taken in any order. TypeVars are fingerprinted by their name,
+    variance, bound and constraints, and NewTypes by their module, name and
+    supertype. `TypeError` is raised for objects that would have a different
+    fingerprint in another process, such as NewTypes before 3.10, which don't
+    know their module, and objects with the default repr.
+
+    Fingerprints depend on the names of the classes, so classes with the same
+    module and qualified name have the same fingerprint, and they can change
+    between Python versions.
+
+    Fingerprints are cached by the identity of the type, whilst it's alive or
+    until `fingerprint.cache_clear` is called.
+
+    Example:
+
+        fingerprint(Dict[str, int]) == fingerprint(Dict[str, int])
+        fingerprint(Union[int, str]) == fingerprint(Union[str, int])
+        fingerprint(List[int]) != fingerprint(Sequence[int])
+    """
+    return _CACHE(type_)
+
+
+fingerprint.cache_clear = _CACHE.cache_clear
@@ -0,0 +1,135 @@
+import typing
+
+from .get_mro import get_mro
+from ..core import get_type_info, get_typing
+from ..core.helpers import IdentityCache, typing_
+
+_MISSING = object()
+
+
+def _is_subclass(class_, ancestor):
+    try:
+        return issubclass(class_, ancestor)
+    except TypeError:
+        return False
+
+
+class Fold(object):  # pylint: disable=useless-object-inheritance
+    """
+    Fold types into values, with handlers registered for typing types.
+
+    Handlers are called with the type, its type info, and the folded values
+    of its arguments. A handler is found from the typing type of the type,
+    then the typing types of its MRO, and then the most specific class
+    registered that the class is a subclass of, as builtins are registered
+    with their ABCs rather than subclassing them. So a handler for `Mapping`
+    is used for `Dict` and subclasses of `Mapping` too. Handlers for `object`
+    are used last. Types without a handler use `default`, and raise a
+    `ValueError` if there is none.
+
+    Folded values are cached by the identity of the type, so arguments used
+    in more than one type are folded once. Registering a handler clears the
+    cache.
+
+    Example:
+
+        names = Fold(lambda type_, type_info, args: type_.__name__)
+        names.register(Union, lambda type_, type_info, args: ' | '.join(args))
+        names(Union[int, str]) == 'int | str'
+    """
+
+    def __init__(self, default=None):
+        self._default = default
+        self._handlers = {}
+        self._dispatch = {}
+        self._cache = IdentityCache(None)
+
+    def register(self, typing_type, handler=None):
+        """
+        Register the handler for the typing type, or class type.
+
+        Without a handler this returns a decorator registering the function
+        it decorates. `Optional` is `Union`, and so uses its handler.
+        `typing.NewType` is the typing type of all NewTypes.
+        """
+        if handler is None:
+            return lambda handler_: self.register(typing_type, handler_)
+        if typing_type is typing.NewType:
+            typing_type = typing_.NewType
+        self._handlers[get_typing(typing_type)[0] or typing_type] = handler
+        self._dispatch.clear()
+        self.cache_clear()
+        return handler
+
+    def _get_handler(self, type_info):
+        if type_info is None:
+            return self._default
+        key = type_info.typing
+        handler = self._dispatch.get(key, _MISSING)
+        if handler is _MISSING:
+            handler = self._handlers.get(key)
+            if handler is None:
+                handler = self._find_handler(type_info.class_)
+            self._dispatch[key] = handler
+        return handler
+
+    def _find_handler(self, class_):
+        """Find the handler from the MRO, then the classes registered as ancestors."""
+        for parent in get_mro(class_):
+            if parent is object:
+                break
+            handler = self._handlers.get(get_typing(parent)[0] or parent)
+            if handler is not None:
+                return handler
+        ancestors = []
+        for typing_type in self._handlers:
+            ancestor = get_typing(typing_type)[1] or typing_type
+            if ancestor is not object and _is_subclass(class_, ancestor):
+                ancestors.append((ancestor, typing_type))
+        for ancestor, typing_type in ancestors:
+            if not any(
+                other is not ancestor and _is_subclass(other, ancestor)
+                for other, _ in ancestors
+            ):
+                return self._handlers[typing_type]
+        handler = self._handlers.get(object)
+        return self._default if handler is None else handler
+
+    def _fold(self, type_, type_info, args):
+        handler = self._get_handler(type_info)
+        if handler is None:
+            raise ValueError('No handler to fold {0!r}'.format(type_))
+        return handler(type_, type_info, args)
+
+    def __call__(self, type_):
+        """Fold the type, and its arguments, into a value."""
+        folded = {}
+        stack = [(type_, None)]
+        while stack:
+            type__, type_info = stack.pop()
+            if id(type__) in folded:
+                continue
+            if type_info is None:
+                value = self._cache.get(type__, _MISSING)
+                if value is not _MISSING:
+                    folded[id(type__)] = (type__, value)
+                    continue
+                type_info = get_type_info(type__)
+                args = () if type_info is None else type_info.args
+                pending = [arg for arg in args if id(arg) not in folded]
+                if pending:
+                    # Fold the arguments first, then come back to the type.
+                    stack.append((type__, type_info))
+                    stack.extend((arg, None) for arg in reversed(pending))
+                    continue
+            args = () if type_info is None else type_info.args
+            args = tuple(folded[id(arg)][1] for arg in args)
+            value = self._fold(type__, type_info, args)
+            self._cache.set(type__, value)
+            # Hold the type, so its id isn't reused whilst folding.
+            folded[id(type__)] = (type__, value)
+        return folded[id(type_)][1]
+
+    def cache_clear(self):
+        """Clear the folded values."""
+        self._cache.cache_clear()
@@ -112,6 +112,26 @@ else:
         return bases
 
 
+_TEMPLATES = {}
+
+
+def _get_template(class_):
+    """
+    Get the bases of a typing class, with the amount of arguments each base takes.
+
+    Typing classes are from the standard library, so their bases don't change
+    and the template is built once per class. Bases that aren't specialised
+    by the arguments take none.
+    """
+    template = _TEMPLATES.get(class_)
+    if template is None:
+        template = _TEMPLATES[class_] = tuple(
+            (base, len(get_parameters(base.typing)) if is_typing(base.class_) else 0)
+            for base in _bases(class_)
+        )
+    return template
+
+
 def get_bases(type_):
     """
     Gets the bases of the type, returns the typing type, class type and orig type.
@@ -132,18 +152,11 @@ def get_bases(type_):
         or not is_typing(type_info.class_)
     ):
         return _bases(type_info.class_)
-    bases = ()
-    for base in _bases(type_info.class_):
-        if not is_typing(base.class_):
-            bases += (base,)
-        else:
-            parameters = get_parameters(base.typing)
-            if parameters:
-                bases += (_BaseObj(
-                    base.typing,
-                    base.class_,
-                    base.typing[type_info.args[:len(parameters)]],
-                ),)
-            else:
-                bases += (base,)
-    return bases
+    args = type_info.args
+    # Bases taking more arguments than the type has, such as `Dict` for
+    # `Counter`, can't be specialised by them.
+    return tuple(
+        _BaseObj(base.typing, base.class_, base.typing[args[:amount]])
+        if 0 < amount <= len(args) else base
+        for base, amount in _get_template(type_info.class_)
+    )
@@ -0,0 +1,172 @@
+import collections
+import typing
+import weakref
+
+from .get_bases import _BaseObj, get_bases
+from ..core import get_args, get_parameters, get_type_info, get_typing
+from ..core.helpers import is_typing, safe_dict_get
+
+_TEMPLATES = weakref.WeakKeyDictionary()
+
+
+def _link(arg, parameters):
+    """
+    Link the argument to the positions of the parameters it uses.
+
+    Returns the index of the parameter if the argument is one, a tuple of the
+    indexes, or `None`s, of the argument's own parameters if it uses any, or
+    `None` if the argument is left as is.
+    """
+    index = safe_dict_get(parameters, arg)
+    if index is not None:
+        return index
+    links = tuple(safe_dict_get(parameters, p) for p in get_parameters(arg))
+    if any(link is not None for link in links):
+        return links
+    return None
+
+
+def _fill(template, args):
+    """Fill the template with the arguments of the class it was built for."""
+    if not args:
+        return tuple(arg for arg, _ in template)
+    filled = []
+    for arg, link in template:
+        if link is None:
+            filled.append(arg)
+        elif isinstance(link, int):
+            filled.append(args[link])
+        else:
+            filled.append(arg[tuple(
+                p if index is None else args[index]
+                for p, index in zip(get_parameters(arg), link)
+            )])
+    return tuple(filled)
+
+
+def _build(args, parameters):
+    """Build a template of the arguments, to be filled by the parameters' values."""
+    parameters = {p: index for index, p in enumerate(parameters)}
+    return tuple((arg, _link(arg, parameters)) for arg in args)
+
+
+def _is_related(class_, ancestor):
+    try:
+        return issubclass(class_, ancestor)
+    except TypeError:
+        return True
+
+
+def _uses_parameters(template):
+    return any(link is not None for _, link in template)
+
+
+def _class_bases(class_):
+    """Get the bases of the class, with typing classes specialised by their parameters."""
+    if is_typing(class_):
+        t_typing, _ = get_typing(class_)
+        parameters = get_parameters(t_typing)
+        if class_ is collections.Counter and parameters:
+            # `Counter[T]` is a `Dict[T, int]`, but its base is a bare `dict`.
+            return (_BaseObj(typing.Dict, dict, typing.Dict[parameters[0], int]),)
+        if parameters:
+            return get_bases(t_typing[parameters])
+    return get_bases(class_)
+
+
+def _registered_template(parameters, ancestor):
+    """
+    Map the parameters of a typing class onto an ABC it's registered with, by position.
+
+    Builtins, such as `dict`, are registered with their ABCs rather than
+    subclassing them, so `Dict[KT, VT]` doesn't have `Mapping[KT, VT_co]` as
+    a base. `None` if the ABC takes more parameters than the class has.
+    """
+    amount = len(get_parameters(get_typing(ancestor)[0]))
+    if len(parameters) < amount:
+        return None
+    return _build(parameters[:amount], parameters)
+
+
+def _get_template(class_, ancestor):
+    """
+    Get the arguments of the ancestor, in terms of the parameters of the class.
+
+    Only the bases related to the ancestor are walked, and the result is
+    memoised per class and ancestor. Typing classes registered with the
+    ancestor, rather than subclassing it, or whose base isn't specialised,
+    are mapped onto it by position. Other classes with a base that isn't
+    specialised, such as `class A(Mapping)`, have `()` as the arguments
+    aren't known. `None` if the class doesn't have the ancestor as a base.
+    """
+    templates = _TEMPLATES.get(class_)
+    if templates is None:
+        templates = _TEMPLATES.setdefault(class_, {})
+    if ancestor in templates:
+        return templates[ancestor]
+
+    template = None
+    parameters = get_parameters(get_typing(class_)[0] or class_)
+    if class_ is ancestor:
+        template = _build(parameters, parameters)
+    else:
+        for base in _class_bases(class_):
+            if not _is_related(base.class_, ancestor):
+                continue
+            base_template = _get_template(base.class_, ancestor)
+            if base_template is None:
+                continue
+            args = get_args(base.orig) if base.orig is not None else ()
+            if args or not _uses_parameters(base_template):
+                template = _build(_fill(base_template, args), parameters)
+            elif is_typing(class_):
+                template = _registered_template(parameters, ancestor)
+            else:
+                # The base's own parameters mean nothing to the class.
+                template = ()
+            break
+        else:
+            if (
+                is_typing(class_)
+                and is_typing(ancestor)
+                and _is_related(class_, ancestor)
+            ):
+                template = _registered_template(parameters, ancestor)
+    templates[ancestor] = template
+    return template
+
+
+def get_generic_args_for(type_, ancestor):
+    """
+    Get the arguments of the ancestor, resolved through the bases of the type.
+
+    The ancestor can be a typing type or class type. Builtins are registered
+    with their ABCs, so their parameters are mapped onto the ABC's by
+    position, as in `Dict[KT, VT]` and `Mapping[KT, VT_co]`. `None` is
+    returned if the type doesn't have the ancestor as a base, or its
+    arguments can't be mapped onto the ancestor's, and `()` if the type
+    subclasses a base without arguments, such as `class A(Mapping)`.
+    TypeVars that the type doesn't provide are left in the arguments, but the
+    parameters of its bases never are.
+
+    Example:
+
+        class MyMapping(Mapping[str, T]):
+            pass
+
+        get_generic_args_for(MyMapping[int], Mapping) == (str, int)
+        get_generic_args_for(MyMapping, Iterable) == (str,)
+    """
+    type_info = get_type_info(type_)
+    if type_info is None:
+        return None
+    ancestor = get_typing(ancestor)[1] or ancestor
+    class_ = type_info.class_
+    if class_ is ancestor:
+        return type_info.args or type_info.parameters
+    if not isinstance(class_, type):
+        return None
+    template = _get_template(class_, ancestor)
+    if template is None:
+        return None
+    return _fill(template, type_info.args)
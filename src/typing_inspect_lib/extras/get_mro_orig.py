@@ -2,7 +2,7 @@ import typing
 
 from .get_bases import _BaseObj
 from .get_mro import get_mro
-from .get_parents import get_parents
+from .get_parents import _get_bases_memo, _get_root
 from ..core import get_args, get_type_info, get_typing
 from ..core.helpers import (
     PY_35, VERSION, is_typing, pairwise,
@@ -29,44 +29,77 @@ else:
             raise ValueError("Didn't consume all parents: {0}".format(parents))
 
 
-def get_mro_orig(type_):
-    """
-    Gets the mro of the type. Returning them as typing types, class types and orig types.
+def _get_args_memo(memo, type_):
+    """Get the arguments of the type, only calling `get_args` once per type."""
+    entry = memo.get(id(type_))
+    if entry is None:
+        # Hold the type, so its id isn't reused whilst in the memo.
+        entry = memo[id(type_)] = (type_, get_args(type_))
+    return entry[1]
 
-    Builtin types are converted to their class type to get the MRO
-    and so `Generic` is missing.
+
+def _merge_parents(classes, args_memo):
+    """Merge the parents that share a class into one, joining differing arguments."""
+    if not all(a.typing is b.typing for a, b in pairwise(classes)):
+        raise ValueError('MRO has two different types using the same class')
+
+    if len(classes) == 1 or all(c.orig is None for c in classes):
+        # Nothing to join, so the parent is already the merged parent.
+        return classes[0]
+
+    args = _inner_set(
+        _get_args_memo(args_memo, c.orig) if c.orig is not None else {}
+        for c in classes
+    )
+    new_args = []
+    for arg in args:
+        if len(arg) == 1:
+            new_args.append(arg.pop())
+        else:
+            new_args.append(typing.Union[tuple(arg)])
+    class__ = classes[0]
+    return _BaseObj(class__.typing, class__.class_, class__.typing[tuple(new_args)])
+
+
+def iter_mro_orig(type_):
     """
-    parents = {}
-    for parent in get_parents(type_):
-        parents.setdefault(parent.class_, []).append(parent)
+    Iterate the mro of the type, as typing types, class types and orig types.
 
-    mro = ()
+    A class's parents are all bases of classes before it in the MRO, and so
+    the parents are found as the MRO is iterated. Stopping early doesn't
+    find the rest.
+    """
+    root = _get_root(type_)
+    parents = {root.class_: [root]}
+    bases_memo = {}
+    args_memo = {}
     for class_ in get_mro(type_):
-        if class_ not in parents:
+        classes = parents.pop(class_, None)
+        if classes is None:
             t_typing, t_class = get_typing(class_)
-            mro += (_BaseObj(t_typing or class_, t_class or class_, None),)
+            yield _BaseObj(t_typing or class_, t_class or class_, None)
             continue
 
-        classes = parents.pop(class_)
-        if not all(a.typing is b.typing for a, b in pairwise(classes)):
-            raise ValueError('MRO has two different types using the same class')
-
-        if all(c.orig is None for c in classes):
-            mro += (classes[0],)
-            continue
-
-        args = _inner_set(get_args(c.orig) if c.orig is not None else {} for c in classes)
-        new_args = ()
-        for arg in args:
-            if not args:
-                raise ValueError('One argument is empty')
-            if len(arg) == 1:
-                new_args += (arg.pop(),)
+        yield _merge_parents(classes, args_memo)
+        for parent in classes:
+            if parent is root:
+                bases = _get_bases_memo(bases_memo, type_)
             else:
-                new_args += (typing.Union[tuple(arg)],)
-        class__ = classes[0]
-        mro += (_BaseObj(class__.typing, class__.class_, class__.typing[new_args]),)
+                bases = _get_bases_memo(
+                    bases_memo,
+                    parent.class_ if parent.orig is None else parent.orig,
+                )
+            for base in bases:
+                parents.setdefault(base.class_, []).append(base)
 
     _ensure_consumed_parents(type_, parents)
 
-    return mro
+
+def get_mro_orig(type_):
+    """
+    Gets the mro of the type. Returning them as typing types, class types and orig types.
+
+    Builtin types are converted to their class type to get the MRO
+    and so `Generic` is missing.
+    """
+    return tuple(iter_mro_orig(type_))
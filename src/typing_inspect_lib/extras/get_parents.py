@@ -2,22 +2,52 @@ from .get_bases import _BaseObj, get_bases
 from ..core import get_type_info
 
 
-def _get_parents(type_):
-    parents = ()
-    for base in get_bases(type_):
-        parents += (base,)
-        parents += _get_parents(base.class_ if base.orig is None else base.orig)
-    return parents
+def _get_bases_memo(memo, type_):
+    """Get the bases of the type, only calling `get_bases` once per type."""
+    entry = memo.get(id(type_))
+    if entry is None:
+        # Hold the type, so its id isn't reused whilst in the memo.
+        entry = memo[id(type_)] = (type_, get_bases(type_))
+    return entry[1]
 
 
-def get_parents(type_):
-    """Get the parents of the types, returns the typing type, class type and orig type."""
+def _iter_parents(type_):
+    """
+    Iterate the parents of the type, depth first in the order of the bases.
+
+    Shared ancestors reuse the bases found the first time they're reached.
+    """
+    memo = {}
+    stack = [iter(_get_bases_memo(memo, type_))]
+    while stack:
+        base = next(stack[-1], None)
+        if base is None:
+            stack.pop()
+            continue
+        yield base
+        parent = base.class_ if base.orig is None else base.orig
+        stack.append(iter(_get_bases_memo(memo, parent)))
+
+
+def _get_root(type_):
+    """Get the type itself, as the first of its parents."""
     type_info = get_type_info(type_)
     if type_info is None:
-        typing_ = type_
-        class_ = type_
-        orig = None
-    else:
-        typing_, class_ = type_info.typing, type_info.class_
-        orig = type_ if type_info.args else None
-    return (_BaseObj(typing_, class_, orig),) + _get_parents(type_)
+        return _BaseObj(type_, type_, None)
+    return _BaseObj(type_info.typing, type_info.class_, type_ if type_info.args else None)
+
+
+def iter_parents(type_):
+    """
+    Iterate the parents of the type, returns the typing type, class type and orig type.
+
+    The parents are found as they're iterated, so stopping early doesn't find the rest.
+    """
+    yield _get_root(type_)
+    for parent in _iter_parents(type_):
+        yield parent
+
+
+def get_parents(type_):
+    """Get the parents of the types, returns the typing type, class type and orig type."""
+    return (_get_root(type_),) + tuple(_iter_parents(type_))
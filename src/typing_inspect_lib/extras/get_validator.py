@@ -0,0 +1,319 @@
+import itertools
+import random
+import typing
+
+from .get_generic_args_for import get_generic_args_for
+from ..core import get_type_info
+from ..core.helpers import CacheInfo, IdentityCache, abc, is_typing, typing_
+
+_NONE_TYPE = type(None)
+
+# Validators hold the classes they check, and so the types they're cached by,
+# so only this many validators of each mode are kept.
+_MAXSIZE = 1024
+
+
+class _Compiler(object):  # pylint: disable=useless-object-inheritance
+    """
+    Build the source of a validator, and the namespace it's run in.
+
+    Validators for the `'first'` and `'sample'` modes take the amount of
+    items to check from each collection as their second argument, `limit`.
+    """
+
+    def __init__(self, mode='full'):
+        self.mode = mode
+        self.namespace = {}
+        self._names = {}
+        # The class each `isinstance` condition checks, so unions can merge them.
+        self._classes = {}
+        self._count = 0
+
+    def new_name(self, prefix):
+        self._count += 1
+        return '{0}_{1}'.format(prefix, self._count)
+
+    def constant(self, value):
+        """Get the name the value is stored as in the namespace."""
+        name = self._names.get(id(value))
+        if name is None:
+            name = self._names[id(value)] = self.new_name('_c')
+            self.namespace[name] = value
+        return name
+
+    def compile(self, type_):
+        lines = self.check(type_, 'value')
+        lines = ['    ' + line for line in lines + ['return True']]
+        lines = ['def validate({0}):'.format(self._call_args('value'))] + lines
+        return '\n'.join(lines) + '\n'
+
+    def _call_args(self, name):
+        return name if self.mode == 'full' else name + ', limit'
+
+    def iterate(self, name):
+        """Get the expression iterating the items to check of the collection."""
+        if self.mode == 'full':
+            return name
+        return '{0}({1}, limit)'.format(self.constant(_ITERATE[self.mode]), name)
+
+    def check(self, type_, name):
+        """Get the lines that `return False` if the name isn't an instance of the type."""
+        condition = self.condition(type_, name)
+        if condition == 'True':
+            return []
+        if condition is not None:
+            if condition not in self._classes:
+                condition = '({0})'.format(condition)
+            return ['if not {0}:'.format(condition), '    return False']
+        type_info = get_type_info(type_)
+        if type_info is None or type_info.typing is not typing.Tuple:
+            return self._check_items(type_, type_info, name)
+        return self._check_tuple(type_info, name)
+
+    def condition(self, type_, name):
+        """
+        Get an expression checking the name is an instance of the type.
+
+        Returns `'True'` when everything is an instance, and `None` when the
+        type needs statements to be checked, see `check`.
+        """
+        if type_ is None:
+            type_ = _NONE_TYPE
+        type_info = get_type_info(type_)
+        if type_info is None:
+            if isinstance(type_, type):
+                return self._condition_class(type_, name)
+            raise TypeError("Can't validate against {0!r}".format(type_))
+        typing_type = type_info.typing
+        args = type_info.args
+        if typing_type is typing.Any:
+            return 'True'
+        if typing_type is typing.TypeVar:
+            if type_.__constraints__:
+                return self._condition_union(type_.__constraints__, name)
+            if type_.__bound__ is not None:
+                return self.condition(type_.__bound__, name)
+            return 'True'
+        if typing_type is typing_.NewType:
+            return self.condition(type_.__supertype__, name)
+        if typing_type is typing_.ClassVar:
+            return self.condition(args[0], name) if args else 'True'
+        if typing_type is typing.Union:
+            return self._condition_union(args, name) if args else 'True'
+        if typing_type is typing.Type:
+            return self._condition_type(args, name)
+        if typing_type is typing.Tuple:
+            return None if args else self._condition_class(type_info.class_, name)
+        if args and _item_types(type_, type_info) is not None:
+            return None
+        return self._condition_class(type_info.class_, name)
+
+    def _condition_class(self, class_, name):
+        if class_ is object:
+            return 'True'
+        try:
+            isinstance(None, class_)
+        except TypeError:
+            # Such as `Generic`, and protocols that aren't runtime checkable.
+            raise TypeError("Can't validate against {0!r}".format(class_))
+        condition = 'isinstance({0}, {1})'.format(name, self.constant(class_))
+        self._classes[condition] = class_
+        return condition
+
+    def _condition_union(self, types, name):
+        """Check all the classes in one `isinstance`, then each type needing more."""
+        classes = []
+        conditions = []
+        for type_ in types:
+            condition = self.condition(type_, name)
+            if condition == 'True':
+                return 'True'
+            if condition is None:
+                # Types needing statements are checked by their own validator.
+                validator = self.constant(_get_plan(self.mode, type_))
+                condition = '{0}({1})'.format(validator, self._call_args(name))
+            elif condition in self._classes:
+                classes.append(self._classes[condition])
+                continue
+            conditions.append(condition)
+        if classes:
+            classes = classes[0] if len(classes) == 1 else tuple(classes)
+            conditions.insert(0, self._condition_class(classes, name))
+        if len(conditions) == 1:
+            return conditions[0]
+        return ' or '.join('({0})'.format(condition) for condition in conditions)
+
+    def _condition_type(self, args, name):
+        condition = 'isinstance({0}, type)'.format(name)
+        if not args:
+            return condition
+        type_info = get_type_info(args[0])
+        class_ = args[0] if type_info is None else type_info.class_
+        if not isinstance(class_, type) or class_ is object:
+            return condition
+        return '{0} and issubclass({1}, {2})'.format(
+            condition, name, self.constant(class_),
+        )
+
+    def _check_tuple(self, type_info, name):
+        args = type_info.args
+        lines = [
+            'if not {0}:'.format(self._condition_class(tuple, name)),
+            '    return False',
+        ]
+        if args == ((),):
+            return lines + ['if {0}:'.format(name), '    return False']
+        if len(args) == 2 and args[1] is Ellipsis:
+            item = self.new_name('item')
+            body = self.check(args[0], item)
+            if body:
+                lines += ['for {0} in {1}:'.format(item, self.iterate(name))]
+                lines += ['    ' + line for line in body]
+            return lines
+        items = [self.new_name('item') for _ in args]
+        lines += [
+            'if len({0}) != {1}:'.format(name, len(args)),
+            '    return False',
+            '{0}, = {1}'.format(', '.join(items), name),
+        ]
+        for item, arg in zip(items, args):
+            lines += self.check(arg, item)
+        return lines
+
+    def _check_items(self, type_, type_info, name):
+        """Check the class, and then each item of the collection or mapping."""
+        lines = [
+            'if not {0}:'.format(self._condition_class(type_info.class_, name)),
+            '    return False',
+        ]
+        item_types = _item_types(type_, type_info)
+        items = [self.new_name('key' if len(item_types) == 2 else 'item')]
+        if len(item_types) == 2:
+            items.append(self.new_name('value'))
+        body = []
+        for item, item_type in zip(items, item_types):
+            body += self.check(item_type, item)
+        if body:
+            iterate = '{0}.items()' if len(item_types) == 2 else '{0}'
+            iterate = self.iterate(iterate.format(name))
+            lines += ['for {0} in {1}:'.format(', '.join(items), iterate)]
+            lines += ['    ' + line for line in body]
+        return lines
+
+
+def _item_types(type_, type_info):
+    """
+    Get the types of the items of a collection, or keys and values of a mapping.
+
+    Typing classes take them in order, but the arguments of other classes can
+    be in another order, so they're those the type gives `Iterable` or
+    `Mapping`, see `get_generic_args_for`. Returns `None` for other types, as
+    their items either can't be checked without consuming them, or aren't
+    known.
+    """
+    class_ = type_info.class_
+    if not isinstance(class_, type):
+        return None
+    if issubclass(class_, abc.Mapping):
+        ancestor, amount = abc.Mapping, 2
+    elif issubclass(class_, abc.Sized) and issubclass(class_, abc.Iterable):
+        ancestor, amount = abc.Iterable, 1
+    else:
+        return None
+    if is_typing(class_):
+        args = type_info.args
+    else:
+        args = get_generic_args_for(type_, ancestor)
+    return args if args is not None and len(args) == amount else None
+
+
+def _first(items, limit):
+    return itertools.islice(items, limit)
+
+
+def _sample(items, limit):
+    """
+    Get random items of sequences, and the first items of other collections.
+
+    Items are picked with replacement, so this doesn't depend on the length.
+    """
+    if not isinstance(items, abc.Sequence):
+        return itertools.islice(items, limit)
+    length = len(items)
+    if length <= limit:
+        return items
+    return [items[random.randrange(length)] for _ in range(limit)]
+
+
+_ITERATE = {
+    'first': _first,
+    'sample': _sample,
+}
+
+
+def _compile(type_, mode='full'):
+    compiler = _Compiler(mode)
+    source = compiler.compile(type_)
+    namespace = dict(compiler.namespace)
+    code = compile(source, '<validator {0!r}>'.format(type_), 'exec')
+    exec(code, namespace)  # pylint: disable=exec-used
+    validate = namespace['validate']
+    validate.source = source
+    return validate
+
+
+def _build_plans(mode):
+    return IdentityCache(lambda type_: _compile(type_, mode), maxsize=_MAXSIZE)
+
+
+# The compiled validators of each mode, by the type they check.
+_PLANS = {mode: _build_plans(mode) for mode in ('full', 'first', 'sample')}
+
+
+def _get_plan(mode, type_):
+    """Get the validator of the mode, taking `None` as `NoneType` like typing does."""
+    return _PLANS[mode](_NONE_TYPE if type_ is None else type_)
+
+
+def get_validator(type_):
+    """
+    Get a function checking values are instances of the type.
+
+    The function is generated from the type info of the type, and its
+    arguments, once per type. Containers, mappings and tuples have each item
+    checked in loops, and unions check their classes in a single `isinstance`.
+    Iterators, generators and callables only have their class checked, as
+    checking their items would consume them. `None` is taken as `NoneType`.
+    The source of the function is stored on its `source` attribute.
+
+    Validators hold the classes they check, so the 1024 most recently used are
+    kept, see `get_validator.cache_info` and `get_validator.cache_clear`.
+
+    Example:
+
+        validate = get_validator(List[Dict[str, Union[int, str]]])
+        validate([{'a': 1, 'b': 'c'}]) is True
+        validate([{'a': 1.0}]) is False
+    """
+    return _get_plan('full', type_)
+
+
+def _cache_info():
+    """Report cache statistics, summed over the caches of each mode."""
+    infos = [plans.cache_info() for plans in _PLANS.values()]
+    return CacheInfo(
+        sum(info.hits for info in infos),
+        sum(info.misses for info in infos),
+        _MAXSIZE,
+        sum(info.currsize for info in infos),
+    )
+
+
+def _cache_clear():
+    """Clear the caches and cache statistics."""
+    for plans in _PLANS.values():
+        plans.cache_clear()
+
+
+get_validator.cache_info = _cache_info
+get_validator.cache_clear = _cache_clear
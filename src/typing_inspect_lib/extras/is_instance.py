@@ -0,0 +1,25 @@
+from .get_validator import _PLANS, _get_plan
+
+
+def is_instance(value, type_, mode='full', limit=10):
+    """
+    Check the value is an instance of the type, and its items of the arguments.
+
+    `mode` is how many items of each collection, and mapping, are checked:
+    `'full'` checks them all, `'first'` the first `limit` items, and
+    `'sample'` `limit` random items of sequences, and the first `limit` items
+    of other collections. The checking plan is compiled once per type and mode,
+    see `get_validator`.
+
+    Example:
+
+        is_instance([1, 2, 'a'], List[int]) is False
+        is_instance([1, 2, 'a'], List[int], mode='first', limit=2) is True
+    """
+    if mode not in _PLANS:
+        raise ValueError(
+            "mode must be 'full', 'first' or 'sample', not {0!r}".format(mode),
+        )
+    if mode == 'full':
+        return _get_plan(mode, type_)(value)
+    return _get_plan(mode, type_)(value, limit)
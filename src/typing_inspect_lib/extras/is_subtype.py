@@ -0,0 +1,214 @@
+import typing
+
+from .get_generic_args_for import get_generic_args_for
+from .get_type_var_info import get_type_var_info
+from ..core import get_parameters, get_type_info
+from ..core.get_type_info import _TypeInfo
+from ..core.helpers import IdentityKeysCache, typing_
+
+_CACHE = IdentityKeysCache()
+
+
+def _get_type_info(type_):
+    type_info = get_type_info(type_)
+    if type_info is not None:
+        return type_info
+    if isinstance(type_, type):
+        return _TypeInfo(type_, type_, (), ())
+    raise TypeError("Can't check subtypes of {0!r}".format(type_))
+
+
+def _unwrap(type_, type_info):
+    """Get the type `ClassVar`s and `NewType`s wrap, or `None`."""
+    if type_info.typing is typing_.ClassVar:
+        return type_info.args[0] if type_info.args else typing.Any
+    if type_info.typing is typing_.NewType:
+        return type_.__supertype__
+    return None
+
+
+def _is_type_var_subtype(type_var, right):
+    """Treat the TypeVar as its constraints, or bound, with no bound being `Any`."""
+    info = get_type_var_info(type_var)
+    if info.constraints:
+        return all(is_subtype(constraint, right) for constraint in info.constraints)
+    if info.bound is not None:
+        return is_subtype(info.bound, right)
+    return True
+
+
+def _is_subtype_type_var(left, type_var):
+    """Check the left type fits the constraints, or bound, of the TypeVar."""
+    info = get_type_var_info(type_var)
+    if info.constraints:
+        return any(is_subtype(left, constraint) for constraint in info.constraints)
+    if info.bound is not None:
+        return is_subtype(left, info.bound)
+    return True
+
+
+def _tuple_args(type_info):
+    """Get the item types and if the tuple is variadic, or `None` for `Tuple`."""
+    args = type_info.args
+    if not args:
+        return None
+    if args == ((),):
+        return (), False
+    if len(args) == 2 and args[1] is Ellipsis:
+        return args[:1], True
+    return args, False
+
+
+def _is_tuple_subtype(left_info, right_info):
+    left = _tuple_args(left_info)
+    right = _tuple_args(right_info)
+    if left is None or right is None:
+        return True
+    (left_args, left_variadic), (right_args, right_variadic) = left, right
+    if right_variadic:
+        return all(is_subtype(arg, right_args[0]) for arg in left_args)
+    if left_variadic or len(left_args) != len(right_args):
+        return False
+    return all(is_subtype(l_, r_) for l_, r_ in zip(left_args, right_args))
+
+
+def _is_callable_subtype(left_info, right_info):
+    """Arguments are contravariant, and the return type covariant."""
+    left_args = left_info.args
+    right_args = right_info.args
+    if not left_args or not right_args:
+        return True
+    if not is_subtype(left_args[-1], right_args[-1]):
+        return False
+    if left_args[0] is Ellipsis or right_args[0] is Ellipsis:
+        return True
+    if len(left_args) != len(right_args):
+        return False
+    return all(is_subtype(r_, l_) for l_, r_ in zip(left_args[:-1], right_args[:-1]))
+
+
+def _is_related(left_class, right_class):
+    try:
+        return issubclass(left_class, right_class)
+    except TypeError:
+        return False
+
+
+def _ancestor_args(left, left_info, right_class, amount):
+    """
+    Get the arguments the left type gives the ancestor.
+
+    `()` if they're unknown, such as for a bare `List`, and `None` if they
+    can't be resolved, see `get_generic_args_for`.
+    """
+    if left_info.class_ is right_class:
+        return left_info.args
+    if left_info.typing is typing.Tuple:
+        # Tuples are sequences of the union of their items.
+        tuple_args = _tuple_args(left_info)
+        if tuple_args is None or amount != 1:
+            return ()
+        return (typing.Union[tuple_args[0]],) if tuple_args[0] else ()
+    return get_generic_args_for(left, right_class)
+
+
+def _is_generic_subtype(left, left_info, right_info):
+    if not _is_related(left_info.class_, right_info.class_):
+        return False
+    if not right_info.args:
+        return True
+    if right_info.typing is typing.Tuple:
+        if left_info.typing is not typing.Tuple:
+            return True
+        return _is_tuple_subtype(left_info, right_info)
+    if right_info.typing is typing.Callable:
+        if left_info.typing is not typing.Callable:
+            return True
+        return _is_callable_subtype(left_info, right_info)
+    parameters = get_parameters(right_info.typing)
+    args = _ancestor_args(left, left_info, right_info.class_, len(parameters))
+    if args is None:
+        return False
+    if len(args) != len(right_info.args):
+        return True
+    for parameter, l_, r_ in zip(parameters, args, right_info.args):
+        info = get_type_var_info(parameter)
+        if info.covariant:
+            result = is_subtype(l_, r_)
+        elif info.contravariant:
+            result = is_subtype(r_, l_)
+        else:
+            result = is_subtype(l_, r_) and is_subtype(r_, l_)
+        if not result:
+            return False
+    return True
+
+
+def _is_subtype(left, right):
+    if right is typing.Any or right is object or left is typing.Any:
+        return True
+    left_info = _get_type_info(left)
+    right_info = _get_type_info(right)
+    if left_info.typing is typing.Union:
+        return all(is_subtype(arg, right) for arg in left_info.args)
+    if right_info.typing is typing.Union:
+        if any(is_subtype(left, arg) for arg in right_info.args):
+            return True
+        # Wrapped types and TypeVars can be covered by the union as a whole,
+        # such as `TypeVar('T', int, str)` by `Union[int, str]`.
+
+    unwrapped = _unwrap(left, left_info)
+    if unwrapped is not None:
+        return is_subtype(unwrapped, right)
+    if left_info.typing is typing.TypeVar:
+        return _is_type_var_subtype(left, right)
+    if right_info.typing is typing.Union:
+        return False
+
+    if right_info.typing is typing_.ClassVar:
+        return is_subtype(left, _unwrap(right, right_info))
+    if right_info.typing is typing_.NewType:
+        return False
+    if right_info.typing is typing.TypeVar:
+        return _is_subtype_type_var(left, right)
+
+    if left_info.typing is typing.Type and right_info.typing is typing.Type:
+        if not left_info.args or not right_info.args:
+            return True
+        return is_subtype(left_info.args[0], right_info.args[0])
+    return _is_generic_subtype(left, left_info, right_info)
+
+
+def is_subtype(left, right):
+    """
+    Check the left type is a subtype of the right type.
+
+    Arguments are checked by the variance of the parameters they're for, and
+    unions, tuples, callables and `Type` follow their own rules. TypeVars are
+    treated as their constraints, or bound, and are like `Any` without either.
+    Arguments that aren't known, such as for a bare `List`, are like `Any`,
+    but types whose arguments for the right type's class can't be resolved,
+    see `get_generic_args_for`, aren't subtypes.
+
+    Results are memoised for each pair of types, whilst both are alive, see
+    `is_subtype.cache_info` and `is_subtype.cache_clear`.
+
+    Example:
+
+        is_subtype(List[bool], Sequence[int]) is True
+        is_subtype(List[bool], List[int]) is False
+        is_subtype(Callable[[int], bool], Callable[[bool], int]) is True
+        is_subtype(Tuple[int, bool], Tuple[int, ...]) is True
+    """
+    if left is right:
+        return True
+    keys = left, right
+    result = _CACHE.get(keys)
+    if result is None:
+        result = _is_subtype(left, right)
+        _CACHE.set(keys, result)
+    return result
+
+
+is_subtype.cache_info = _CACHE.cache_info
+is_subtype.cache_clear = _CACHE.cache_clear
@@ -0,0 +1,189 @@
+import collections
+import typing
+
+from .is_subtype import _ancestor_args, _get_type_info, _is_related
+from .unify import unify
+from ..core import get_parameters
+from ..core.helpers import IdentityCache, abc
+
+_MISSING = object()
+
+_Match = collections.namedtuple('Match', ['pattern', 'value', 'bindings'])
+
+
+def _class(type_):
+    """Get the class the type is an instance of, or `None` if it matches anything."""
+    if isinstance(type_, typing.TypeVar) or type_ is typing.Any or type_ is object:
+        return None
+    type_info = _get_type_info(type_)
+    if type_info.typing is typing.Union or not isinstance(type_info.class_, type):
+        return None
+    return type_info.class_
+
+
+def _is_kin(left, right):
+    """Check either class is a subclass of the other, as variance can go either way."""
+    return _is_related(left, right) or _is_related(right, left)
+
+
+class _Bucket(object):  # pylint: disable=useless-object-inheritance
+    """
+    The patterns of a class, indexed by the class of each of their arguments.
+
+    Patterns with a TypeVar, `Any` or `Union` argument are wild at that position.
+    """
+
+    def __init__(self, type_info):
+        self.class_ = type_info.class_
+        self.indexes = set()
+        self.positions = []
+        self.amount = 0
+        if _is_indexed(self.class_):
+            self.amount = len(get_parameters(type_info.typing))
+
+    def add(self, index, type_info):
+        args = type_info.args[:self.amount]
+        while len(self.positions) < len(args):
+            # Patterns added before had no argument here, so are wild.
+            self.positions.append((collections.OrderedDict(), set(self.indexes)))
+        for position, (kinds, wild) in enumerate(self.positions):
+            class_ = _class(args[position]) if position < len(args) else None
+            if class_ is None:
+                wild.add(index)
+            else:
+                kinds.setdefault(class_, set()).add(index)
+        self.indexes.add(index)
+
+    def candidates(self, type_, type_info):
+        """Get the patterns whose arguments could match the arguments of the type."""
+        candidates = self.indexes
+        if not self.positions:
+            return candidates
+        args = _ancestor_args(type_, type_info, self.class_, self.amount)
+        if args is None:
+            return set()
+        for arg, (kinds, wild) in zip(args, self.positions):
+            class_ = _class(arg)
+            if class_ is None:
+                continue
+            allowed = set(wild)
+            for kind, indexes in kinds.items():
+                if _is_kin(class_, kind):
+                    allowed |= indexes
+            candidates = candidates & allowed
+            if not candidates:
+                break
+        return candidates
+
+
+def _is_indexed(class_):
+    """Tuples and callables have their own argument rules, so only use their class."""
+    return not _is_related(class_, tuple) and class_ is not abc.Callable
+
+
+class Matcher(object):  # pylint: disable=useless-object-inheritance
+    """
+    Match types to the first pattern registered that they solve, see `unify`.
+
+    The patterns are compiled into a decision tree. The first level is the
+    class of the pattern, found from the class of the type, and the second the
+    classes of the pattern's arguments, found from the type's arguments. Only
+    the patterns left are solved. Patterns without a class, such as TypeVars,
+    and unions are always solved.
+
+    Matches are cached by the identity of the type. Registering a pattern
+    clears the cache.
+
+    Example:
+
+        matcher = Matcher([(Sequence[T], 'sequence'), (Mapping[str, Any], 'mapping')])
+        matcher.match(List[int]) == (Sequence[T], 'sequence', {T: int})
+        matcher.match(Dict[str, int]) == (Mapping[str, Any], 'mapping', {})
+        matcher.match(int) is None
+    """
+
+    def __init__(self, patterns=()):
+        self._patterns = []
+        self._buckets = collections.OrderedDict()
+        self._always = set()
+        self._unions = set()
+        self._classes = {}
+        self._cache = IdentityCache(None)
+        for pattern, value in patterns:
+            self.register(pattern, value)
+
+    def register(self, pattern, value):
+        """Register the pattern, matching after the patterns already registered."""
+        index = len(self._patterns)
+        self._patterns.append((pattern, value))
+        type_info = _get_type_info(pattern)
+        if type_info.typing is typing.Union:
+            self._unions.add(index)
+            members = type_info.args
+        else:
+            members = (pattern,)
+        for member in members:
+            class_ = _class(member)
+            if class_ is None:
+                self._always.add(index)
+                continue
+            member_info = _get_type_info(member)
+            bucket = self._buckets.get(class_)
+            if bucket is None:
+                bucket = self._buckets[class_] = _Bucket(member_info)
+            bucket.add(index, member_info)
+        self._classes.clear()
+        self.cache_clear()
+
+    def _get_buckets(self, class_):
+        """Get the buckets of the classes the class is a subclass of."""
+        buckets = self._classes.get(class_)
+        if buckets is None:
+            buckets = self._classes[class_] = [
+                bucket
+                for key, bucket in self._buckets.items()
+                if _is_related(class_, key)
+            ]
+        return buckets
+
+    def _candidates(self, type_):
+        type_info = _get_type_info(type_)
+        if type_info.typing is typing.Union:
+            # All members must match a pattern, unless a union pattern matches.
+            candidates = None
+            for member in type_info.args:
+                member_candidates = self._candidates(member)
+                if candidates is None:
+                    candidates = member_candidates
+                else:
+                    candidates &= member_candidates
+            return (candidates or set()) | self._unions | self._always
+        class_ = _class(type_)
+        if class_ is None:
+            return set(range(len(self._patterns)))
+        candidates = set(self._always)
+        for bucket in self._get_buckets(class_):
+            candidates |= bucket.candidates(type_, type_info)
+        return candidates
+
+    def _match(self, type_):
+        for index in sorted(self._candidates(type_)):
+            pattern, value = self._patterns[index]
+            bindings = unify(pattern, type_)
+            if bindings is not None:
+                return _Match(pattern, value, bindings)
+        return None
+
+    def match(self, type_):
+        """Get the first pattern the type matches, its value and bindings, or `None`."""
+        match = self._cache.get(type_, _MISSING)
+        if match is _MISSING:
+            match = self._match(type_)
+            self._cache.set(type_, match)
+        if match is None:
+            return None
+        return _Match(match.pattern, match.value, dict(match.bindings))
+
+    def cache_clear(self):
+        """Clear the cached matches."""
+        self._cache.cache_clear()
@@ -0,0 +1,72 @@
+import typing
+
+from ..core import get_parameters, get_type_info
+from ..core.helpers import IdentityCache, IdentityKeysCache
+
+_PARAMETERS = IdentityCache(get_parameters)
+
+# The results by the type and the types bound to its parameters, stored as
+# `(result,)` so the cache can swap out a reference to the type.
+_CACHE = IdentityKeysCache()
+
+
+def _rebuild(type_info, args):
+    """Subscribe the typing type with the arguments, held as in the type info."""
+    typing_type = type_info.typing
+    if typing_type is typing.Callable:
+        if args[0] is Ellipsis:
+            return typing_type[Ellipsis, args[-1]]
+        return typing_type[list(args[:-1]), args[-1]]
+    return typing_type[args[0] if len(args) == 1 else args]
+
+
+def _substitute(type_, bindings):
+    type_info = get_type_info(type_)
+    if type_info is None or not type_info.args:
+        # Bare generics declare their parameters, rather than use them.
+        return type_
+    args = tuple(substitute(arg, bindings) for arg in type_info.args)
+    if all(new is old for new, old in zip(args, type_info.args)):
+        return type_
+    return _rebuild(type_info, args)
+
+
+def substitute(type_, bindings):
+    """
+    Substitute the bindings for the TypeVars the type uses.
+
+    `bindings` is `{TypeVar: type}`, as returned by `unify`. Only the types
+    that use the TypeVars are rebuilt, others are returned as is, so untouched
+    arguments are kept. Bare generics, such as `List`, are returned as is.
+
+    Results are memoised by the type and the types bound to its TypeVars,
+    whilst they're alive, see `substitute.cache_info` and
+    `substitute.cache_clear`.
+
+    Example:
+
+        substitute(Dict[K, List[V]], {K: str, V: int}) == Dict[str, List[int]]
+        substitute(Dict[str, int], {K: str}) is Dict[str, int]
+    """
+    if isinstance(type_, typing.TypeVar):
+        return bindings.get(type_, type_)
+    parameters = _PARAMETERS(type_)
+    if not parameters:
+        return type_
+    args = tuple([bindings.get(parameter, parameter) for parameter in parameters])
+    keys = (type_,) + args
+    result = _CACHE.get(keys)
+    if result is None:
+        result = (_substitute(type_, bindings),)
+        _CACHE.set(keys, result)
+    return result[0]
+
+
+def _cache_clear():
+    """Clear the caches and cache statistics."""
+    _PARAMETERS.cache_clear()
+    _CACHE.cache_clear()
+
+
+substitute.cache_info = _CACHE.cache_info
+substitute.cache_clear = _cache_clear
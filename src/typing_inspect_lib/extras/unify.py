@@ -0,0 +1,307 @@
+import typing
+
+from .get_type_var_info import get_type_var_info
+from .is_subtype import (
+    _ancestor_args, _get_type_info, _is_related, _tuple_args, is_subtype,
+)
+from .substitute import substitute
+from ..core import get_parameters
+from ..core.helpers import CacheInfo, IdentityKeysCache
+
+# How the type must relate to the pattern, once the bindings are substituted.
+_COVARIANT = 'covariant'  # The type is a subtype of the pattern.
+_CONTRAVARIANT = 'contravariant'  # The pattern is a subtype of the type.
+_INVARIANT = 'invariant'  # The type is the pattern.
+
+_FLIPPED = {
+    _COVARIANT: _CONTRAVARIANT,
+    _CONTRAVARIANT: _COVARIANT,
+    _INVARIANT: _INVARIANT,
+}
+
+_MISSING = object()
+
+# The bindings solving each pattern and type, by the variance they're solved
+# by. Bindings are stored as `(TypeVar, type, ...)`, so the cache can swap out
+# references to the pattern and type.
+_CACHES = {
+    variance: IdentityKeysCache()
+    for variance in (_COVARIANT, _CONTRAVARIANT, _INVARIANT)
+}
+
+
+def _variance(parameter):
+    info = get_type_var_info(parameter)
+    if info.covariant:
+        return _COVARIANT
+    if info.contravariant:
+        return _CONTRAVARIANT
+    return _INVARIANT
+
+
+def _merge(bindings, new):
+    """Add the new bindings, returning `None` if a TypeVar is bound to two types."""
+    if new is None:
+        return None
+    for type_var, type_ in new.items():
+        bound = bindings.setdefault(type_var, type_)
+        if bound is not type_ and bound != type_:
+            return None
+    return bindings
+
+
+def _solve_all(patterns, types, variance=_COVARIANT):
+    bindings = {}
+    for pattern, type_ in zip(patterns, types):
+        bindings = _merge(bindings, _solve(pattern, type_, variance))
+        if bindings is None:
+            return None
+    return bindings
+
+
+def _solve_type_var(type_var, type_):
+    """Bind the TypeVar, to the constraint the type matches if it has any."""
+    info = get_type_var_info(type_var)
+    if info.constraints:
+        for constraint in info.constraints:
+            if is_subtype(type_, constraint):
+                return {type_var: constraint}
+        return None
+    if info.bound is not None and not is_subtype(type_, info.bound):
+        return None
+    return {type_var: type_}
+
+
+def _solve_union(pattern_info, type_, type_info):
+    """
+    Match each member of the type to the first member of the pattern it solves.
+
+    Members of the pattern without TypeVars are tried first, so `None` binds
+    nothing when solving `Optional[T]`.
+    """
+    members = type_info.args if type_info.typing is typing.Union else (type_,)
+    patterns = sorted(pattern_info.args, key=_is_generic)
+    bindings = {}
+    for member in members:
+        for pattern in patterns:
+            new = _solve(pattern, member)
+            if new is not None:
+                break
+        else:
+            return None
+        bindings = _merge(bindings, new)
+        if bindings is None:
+            return None
+    return bindings
+
+
+def _solve_tuple(pattern_info, type_info):
+    patterns = _tuple_args(pattern_info)
+    types = _tuple_args(type_info)
+    if patterns is None or types is None:
+        return {}
+    (patterns, pattern_variadic), (types, variadic) = patterns, types
+    if pattern_variadic:
+        return _solve_all(patterns * len(types), types)
+    if variadic or len(patterns) != len(types):
+        return None
+    return _solve_all(patterns, types)
+
+
+def _solve_callable(pattern, pattern_info, type_, type_info):
+    """
+    Arguments are contravariant, and the return type covariant.
+
+    A TypeVar used by both can be bound to different types by each, such as
+    `T` in `Callable[[T], T]` for `Callable[[int], bool]`. The binding from
+    the arguments, and then the return type, are tried for all of them, and
+    kept if the callable matches once they're substituted.
+    """
+    patterns = pattern_info.args
+    types = type_info.args
+    if not types:
+        return {}
+    returns = _solve(patterns[-1], types[-1])
+    if returns is None or patterns[0] is Ellipsis or types[0] is Ellipsis:
+        return returns
+    if len(patterns) != len(types):
+        return None
+    arguments = _solve_all(patterns[:-1], types[:-1], _CONTRAVARIANT)
+    if arguments is None:
+        return None
+    bindings = _merge(dict(returns), arguments)
+    if bindings is not None:
+        return bindings
+    for first, second in ((returns, arguments), (arguments, returns)):
+        bindings = dict(first)
+        bindings.update(second)
+        if is_subtype(type_, substitute(pattern, bindings)):
+            return bindings
+    return None
+
+
+def _is_generic(pattern):
+    return isinstance(pattern, typing.TypeVar) or bool(get_parameters(pattern))
+
+
+def _is_match(pattern, type_, variance):
+    """Check the type relates to a pattern without TypeVars by the variance."""
+    if variance == _COVARIANT:
+        return is_subtype(type_, pattern)
+    if variance == _CONTRAVARIANT:
+        return is_subtype(pattern, type_)
+    return is_subtype(type_, pattern) and is_subtype(pattern, type_)
+
+
+def _solve_generic(pattern, pattern_info, type_, type_info):
+    if not _is_related(type_info.class_, pattern_info.class_):
+        return None
+    if pattern_info.typing is typing.Tuple:
+        if type_info.typing is not typing.Tuple:
+            return {}
+        return _solve_tuple(pattern_info, type_info)
+    if pattern_info.typing is typing.Callable:
+        if type_info.typing is not typing.Callable:
+            return {}
+        return _solve_callable(pattern, pattern_info, type_, type_info)
+    parameters = get_parameters(pattern_info.typing)
+    args = _ancestor_args(type_, type_info, pattern_info.class_, len(parameters))
+    if args is None:
+        return None
+    if len(args) != len(pattern_info.args):
+        # The arguments aren't known, so the TypeVars are left unbound.
+        return {}
+    bindings = {}
+    for parameter, pattern, arg in zip(parameters, pattern_info.args, args):
+        bindings = _merge(bindings, _solve(pattern, arg, _variance(parameter)))
+        if bindings is None:
+            return None
+    return bindings
+
+
+def _solve_covariant(pattern, type_):
+    pattern_info = _get_type_info(pattern)
+    type_info = _get_type_info(type_)
+    if pattern_info.typing is typing.Union:
+        return _solve_union(pattern_info, type_, type_info)
+    if type_info.typing is typing.Union:
+        return _solve_all([pattern] * len(type_info.args), type_info.args)
+    return _solve_generic(pattern, pattern_info, type_, type_info)
+
+
+def _solve_contravariant(pattern, type_):
+    """Solve the pattern for a supertype, through the arguments it gives its class."""
+    if type_ is typing.Any or type_ is object:
+        return {}
+    pattern_info = _get_type_info(pattern)
+    type_info = _get_type_info(type_)
+    if type_info.typing is typing.Union:
+        for member in type_info.args:
+            bindings = _solve(pattern, member, _CONTRAVARIANT)
+            if bindings is not None:
+                return bindings
+        return None
+    if not _is_related(pattern_info.class_, type_info.class_):
+        return None
+    if not type_info.args:
+        return {}
+    parameters = get_parameters(type_info.typing)
+    args = _ancestor_args(pattern, pattern_info, type_info.class_, len(parameters))
+    if args is None:
+        return None
+    if len(args) != len(type_info.args):
+        return {}
+    bindings = {}
+    for parameter, pattern_arg, arg in zip(parameters, args, type_info.args):
+        variance = _FLIPPED[_variance(parameter)]
+        bindings = _merge(bindings, _solve(pattern_arg, arg, variance))
+        if bindings is None:
+            return None
+    return bindings
+
+
+def _solve_uncached(pattern, type_, variance):
+    if isinstance(pattern, typing.TypeVar):
+        bindings = _solve_type_var(pattern, type_)
+        if bindings is None or variance == _COVARIANT:
+            return bindings
+        # Constraints can be wider than the type, which only covariance allows.
+        return bindings if _is_match(bindings[pattern], type_, variance) else None
+    if not get_parameters(pattern):
+        return {} if _is_match(pattern, type_, variance) else None
+    pattern_info = _get_type_info(pattern)
+    if (
+        variance == _CONTRAVARIANT
+        and pattern_info.typing not in (typing.Union, typing.Tuple, typing.Callable)
+    ):
+        return _solve_contravariant(pattern, type_)
+    bindings = _solve_covariant(pattern, type_)
+    if bindings is None or variance == _COVARIANT:
+        return bindings
+    # Unions, tuples and callables are only solved covariantly, and invariant
+    # arguments must be the same, so check the solution.
+    substituted = substitute(pattern, bindings)
+    return bindings if _is_match(substituted, type_, variance) else None
+
+
+def _solve(pattern, type_, variance=_COVARIANT):
+    cache = _CACHES[variance]
+    keys = pattern, type_
+    items = cache.get(keys, _MISSING)
+    if items is _MISSING:
+        bindings = _solve_uncached(pattern, type_, variance)
+        if bindings is not None:
+            items = tuple(item for pair in bindings.items() for item in pair)
+        else:
+            items = None
+        cache.set(keys, items)
+        return bindings
+    if items is None:
+        return None
+    return dict(zip(items[::2], items[1::2]))
+
+
+def unify(pattern, type_):
+    """
+    Solve the TypeVars of the pattern, so it matches the type.
+
+    Returns `{TypeVar: type}`, or `None` if the type doesn't match the pattern.
+    Arguments are solved by the variance of the parameter they're for, so
+    invariant arguments must match exactly, and callable arguments are
+    contravariant, see `is_subtype`. TypeVars are checked against their
+    bound, and are bound to the constraint matched if they have any.
+    TypeVars are left unbound if the type doesn't give their arguments, such
+    as a bare `Dict`.
+
+    Solutions are memoised for each pair of types, including the pairs of
+    their arguments, whilst both are alive, see `unify.cache_info` and
+    `unify.cache_clear`.
+
+    Example:
+
+        unify(Mapping[K, List[V]], Dict[str, List[int]]) == {K: str, V: int}
+        unify(Mapping[K, List[V]], Dict[str, Set[int]]) is None
+        unify(List[Sequence[T]], List[List[int]]) is None
+    """
+    return _solve(pattern, type_)
+
+
+def _cache_info():
+    """Report cache statistics, summed over the caches of each variance."""
+    infos = [cache.cache_info() for cache in _CACHES.values()]
+    return CacheInfo(
+        sum(info.hits for info in infos),
+        sum(info.misses for info in infos),
+        None,
+        sum(info.currsize for info in infos),
+    )
+
+
+def _cache_clear():
+    """Clear the caches and cache statistics."""
+    for cache in _CACHES.values():
+        cache.cache_clear()
+
+
+unify.cache_info = _cache_info
+unify.cache_clear = _cache_clear
@@ -0,0 +1,62 @@
+import collections
+
+from ..core import get_type_info
+
+_Node = collections.namedtuple('Node', ['type', 'type_info', 'path'])
+
+
+def _get_type_info_memo(memo, type_):
+    """Get the type info of the type, only calling `get_type_info` once per type."""
+    entry = memo.get(id(type_))
+    if entry is None:
+        # Hold the type, so its id isn't reused whilst in the memo.
+        entry = memo[id(type_)] = (type_, get_type_info(type_))
+    return entry[1]
+
+
+def _children(node):
+    if node.type_info is None:
+        return iter(())
+    return enumerate(node.type_info.args)
+
+
+def walk(type_, order='pre'):
+    """
+    Walk the type and its arguments, and their arguments, yielding each as a node.
+
+    Nodes hold the type, its type info and its path, the indexes of the
+    arguments from the type passed to it. `order` is `'pre'` to yield a node
+    before its arguments, or `'post'` to yield it after them. The walk doesn't
+    recurse, and arguments used more than once share their type info.
+
+    Example:
+
+        [(node.type, node.path) for node in walk(Dict[str, List[int]])] == [
+            (Dict[str, List[int]], ()),
+            (str, (0,)),
+            (List[int], (1,)),
+            (int, (1, 0)),
+        ]
+    """
+    if order not in ('pre', 'post'):
+        raise ValueError("order must be 'pre' or 'post', not {0!r}".format(order))
+    pre = order == 'pre'
+
+    memo = {}
+    root = _Node(type_, _get_type_info_memo(memo, type_), ())
+    if pre:
+        yield root
+    stack = [(root, _children(root))]
+    while stack:
+        node, children = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            if not pre:
+                yield node
+            continue
+        index, arg = child
+        child = _Node(arg, _get_type_info_memo(memo, arg), node.path + (index,))
+        if pre:
+            yield child
+        stack.append((child, _children(child)))
@@ -1,4 +1,6 @@
 import itertools
+import random
+import types
 import typing
 
 
@@ -87,3 +89,100 @@ def _build_tests(type_, t_args, args, start_, stop_, obj, fn):
             _build_type(type_, tuples, obj, stop_ > obj)
             + (args_, tuple(a for a in args_ if isinstance(a, typing.TypeVar)))
         )
+
+
+_SYNTHETIC_ARGS = [int, str, bytes, float]
+
+
+def _new_class(name, bases):
+    new_class = getattr(types, 'new_class', None)
+    if new_class is None:
+        return type(name, bases, {})
+    return new_class(name, bases)
+
+
+def _synthetic_class(name, bases, t_args, rotation):
+    """Build a generic class, passing its TypeVars to each base rotated by `rotation`."""
+    t_args = tuple(t_args)
+    args = t_args[rotation:] + t_args[:rotation]
+    try:
+        class_ = _new_class(name, tuple(base[args] for base in bases))
+    except TypeError:
+        # The bases don't have a consistent MRO, so drop the diamond.
+        class_ = _new_class(name, (bases[0][args],))
+    class_.__module__ = __name__
+    return class_
+
+
+def _synthetic_specialisations(class_, t_args):
+    """Specialise the class with every combination of TypeVars and `_SYNTHETIC_ARGS`."""
+    for placements in _find_all_combinations(
+            0, len(_SYNTHETIC_ARGS), len(t_args), fn=lambda i, j: True):
+        if all(placement == -1 for placement in placements):
+            continue
+        args = tuple(
+            t_arg if placement == -1 else _SYNTHETIC_ARGS[placement]
+            for t_arg, placement in zip(t_args, placements)
+        )
+        yield class_[args if len(args) != 1 else args[0]]
+
+
+def _synthetic_forest(index, depth, fan_out, t_args, diamonds, random_):
+    """Yield the classes of a hierarchy, level by level."""
+    level = [_synthetic_class(
+        'Synthetic{0}_0_0'.format(index),
+        (typing.Generic,),
+        t_args,
+        0,
+    )]
+    yield level[0]
+    for depth_ in range(1, depth + 1):
+        next_level = []
+        for position in range(len(level) * fan_out):
+            bases = [level[position // fan_out]]
+            if len(level) > 1 and random_.random() < diamonds:
+                other = random_.choice(level)
+                if other is not bases[0]:
+                    bases.append(other)
+            class_ = _synthetic_class(
+                'Synthetic{0}_{1}_{2}'.format(index, depth_, position),
+                bases,
+                t_args,
+                position % len(t_args),
+            )
+            next_level.append(class_)
+            yield class_
+        level = next_level
+
+
+def build_synthetic_types(
+        count, depth=3, fan_out=2, arity=1, diamonds=0.0, specialise=True, seed=0):
+    """
+    Yield `count` distinct types, from synthetic generic class hierarchies.
+
+    Each hierarchy is `depth` levels below a root, with each class having
+    `fan_out` subclasses and `arity` TypeVars. `diamonds` is the chance that
+    a class also subclasses another class from the level above. Each class is
+    followed by its specialisations, if `specialise`, and new hierarchies are
+    built until there are `count` types. The same arguments build the same
+    hierarchies.
+    """
+    if arity < 1:
+        raise ValueError('arity must be at least 1')
+    if count <= 0:
+        return
+    random_ = random.Random(seed)
+    t_args = [typing.TypeVar('S{0}'.format(index)) for index in range(arity)]
+    for index in itertools.count():
+        for class_ in _synthetic_forest(index, depth, fan_out, t_args, diamonds, random_):
+            yield class_
+            count -= 1
+            if not count:
+                return
+            if not specialise:
+                continue
+            for type_ in _synthetic_specialisations(class_, t_args):
+                yield type_
+                count -= 1
+                if not count:
+                    return
@@ -1,6 +1,10 @@
+import gc
 import itertools
+import os
+import subprocess
 import sys
 import typing
+import weakref
 from unittest import TestCase, skipIf
 
 try:
@@ -15,15 +19,25 @@ try:
 except ImportError:
     HAS_CLASS_VAR = False
 
-from typing_inspect_lib import get_type_info, get_type_var_info
+import typing_inspect_lib
+from typing_inspect_lib import (
+    explain, get_args, get_bases, get_generic_args_for, get_type_info,
+    get_type_info_many, get_type_var_info, get_typing, stats, stats_enable,
+    stats_reset,
+)
+from typing_inspect_lib import extras
 from typing_inspect_lib.core.get_base_type import get_base_type
+from typing_inspect_lib.extras.get_bases import _get_template
+from typing_inspect_lib.extras.get_parents import get_parents
 from typing_inspect_lib.core.get_type_info import _TypeInfo
 from typing_inspect_lib.core.helpers import abc
 from typing_inspect_lib.core.helpers import re
 from typing_inspect_lib.core.helpers import (
     safe_dict_contains, safe_dict_get, safe_dict_get_both, safe_getattr_tuple,
 )
-from typing_inspect_lib.core.helpers import typing_
+from typing_inspect_lib.core.helpers import build_links, links, typing_
+
+from .helpers.build_types import build_synthetic_types
 
 VERSION = sys.version_info[:3]
 
@@ -115,6 +129,12 @@ class TypeInfoTestCase(TestCase):
         for test in self.tests:
             self.assertEqual(test, test)
 
+    @skipIf(VERSION < (3, 7, 0), 'arguments are built from origins before 3.7')
+    def test_shared_args(self):
+        type_ = typing.Mapping[float, int]
+        self.assertIs(get_type_info(type_).args, type_.__args__)
+        self.assertIs(get_type_info(int).args, ())
+
     def test_not_equal_class(self):
         tests = [
             _TypeInfo(1, abc.Mapping, (), ()),
@@ -131,6 +151,93 @@ class TypeInfoTestCase(TestCase):
             self.assertFalse(test_a == test_b)
 
 
+class TypeInfoManyTestCase(TestCase):
+    tests = [
+        int,
+        typing.Mapping[float, int],
+        typing.Mapping,
+        int,
+        object(),
+        typing.Mapping[float, int],
+        typing.Union[int, str],
+    ]
+
+    def test_order(self):
+        self.assertEqual(
+            get_type_info_many(iter(self.tests)),
+            tuple(get_type_info(t) for t in self.tests),
+        )
+
+    def test_duplicates(self):
+        infos = get_type_info_many(self.tests)
+        self.assertIs(infos[0], infos[3])
+
+    def test_cache(self):
+        get_typing.cache_enable()
+        try:
+            self.assertEqual(
+                get_type_info_many(self.tests),
+                tuple(get_type_info(t) for t in self.tests),
+            )
+        finally:
+            get_typing.cache_enable(False)
+
+
+class ExtrasTestCase(TestCase):
+    def test_extras(self):
+        for name in extras.__all__:
+            self.assertIs(getattr(typing_inspect_lib, name), getattr(extras, name))
+            self.assertIn(name, dir(typing_inspect_lib))
+
+    def test_missing(self):
+        with self.assertRaises(AttributeError) as _:  # noqa: F841
+            typing_inspect_lib.get_404  # pylint: disable=pointless-statement
+
+
+class ParentsTestCase(TestCase):
+    def test_diamond(self):
+        T = typing.TypeVar('T')  # noqa: N806
+
+        class A(typing.Generic[T]):
+            pass
+
+        class B(A[T]):
+            pass
+
+        class C(A[T]):
+            pass
+
+        class D(B[int], C[int]):
+            pass
+
+        self.assertEqual(
+            tuple(parent.class_ for parent in get_parents(D)),
+            (D, B, A, typing.Generic, object, C, A, typing.Generic, object),
+        )
+
+
+class BuildLinksTestCase(TestCase):
+    def test_build(self):
+        namespace = {
+            '__name__': 'typing_inspect_lib.core.helpers._links_test',
+            '__package__': 'typing_inspect_lib.core.helpers',
+        }
+        exec(build_links.build(), namespace)  # pylint: disable=exec-used
+        literal_types, typing_objects, special_objects, special_objects_wrapped = (
+            links.read_links()
+        )
+
+        self.assertEqual(namespace['LITERAL_TYPES'], literal_types)
+        for name, types in [
+            ('TYPING_OBJECTS', typing_objects),
+            ('SPECIAL_OBJECTS', special_objects),
+            ('SPECIAL_OBJECTS_WRAPPED', special_objects_wrapped),
+        ]:
+            typing_to_class, class_to_typing = namespace[name]
+            self.assertEqual(typing_to_class, dict(types.typing))
+            self.assertEqual(class_to_typing, dict(types.class_))
+
+
 class SafeHelpersTestCase(TestCase):
     SENTINEL = object()
 
@@ -165,3 +272,1025 @@ class TypeVarInfoTestCase(TestCase):
     def test_raise(self):
         with self.assertRaises(TypeError) as _:  # noqa: F841
             get_type_var_info(object())
+
+
+class TypingDispatchTestCase(TestCase):
+    def test_unhashable(self):
+        self.assertEqual(get_typing([int]), (None, None))
+        self.assertEqual(get_typing({int: [int]}), (None, None))
+
+    def test_new_metaclass(self):
+        class Meta(type):
+            pass
+
+        test = Meta('Test', (object,), {})
+        self.assertEqual(get_typing(test), (None, None))
+        self.assertEqual(get_typing(abc.Mapping), (typing.Mapping, abc.Mapping))
+
+
+class TypingCacheTestCase(TestCase):
+    def setUp(self):
+        get_typing.cache_enable()
+
+    def tearDown(self):
+        get_typing.cache_enable(False)
+
+    def test_hits(self):
+        self.assertEqual(get_typing(typing.Mapping), get_typing(typing.Mapping))
+        hits, misses, maxsize, currsize = get_typing.cache_info()
+        self.assertEqual((hits, misses, maxsize, currsize), (1, 1, None, 1))
+
+        get_typing.cache_clear()
+        self.assertEqual(get_typing.cache_info(), (0, 0, None, 0))
+
+    def test_weak(self):
+        class Test(typing.Generic[typing.T]):
+            pass
+
+        self.assertEqual(get_typing(Test), (Test, Test))
+        self.assertEqual(get_typing(Test), (Test, Test))
+        self.assertEqual(get_typing.cache_info().currsize, 1)
+
+        del Test
+        gc.collect()
+        self.assertEqual(get_typing.cache_info().currsize, 0)
+
+    def test_disable(self):
+        get_typing(int)
+        get_typing.cache_enable(False)
+        get_typing(int)
+        self.assertEqual(get_typing.cache_info(), (0, 0, None, 0))
+
+
+class BasesTemplateTestCase(TestCase):
+    def test_template(self):
+        class_ = get_type_info(typing.Mapping).class_
+        self.assertIs(_get_template(class_), _get_template(class_))
+        for args in [(int, str), (bytes, float)]:
+            origs = [base.orig for base in get_bases(typing.Mapping[args]) if base.orig]
+            for orig in origs:
+                self.assertEqual(get_args(orig), args[:len(get_args(orig))])
+
+    def test_too_few_args(self):
+        bases = get_bases(typing.Counter[str])
+        self.assertTrue(bases)
+        self.assertEqual([base.orig for base in bases], [None] * len(bases))
+
+
+class GenericArgsForTestCase(TestCase):
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    def test_generic_args_for(self):
+        T = typing.TypeVar('T')  # noqa: N806
+        U = typing.TypeVar('U')  # noqa: N806
+
+        class A(typing.Mapping[str, T]):
+            pass
+
+        class B(A[typing.List[U]]):
+            pass
+
+        class C(typing.Mapping[T, T]):
+            pass
+
+        self.assertEqual(get_generic_args_for(A[int], typing.Mapping), (str, int))
+        self.assertEqual(get_generic_args_for(A, typing.Iterable), (str,))
+        self.assertEqual(get_generic_args_for(A, typing.Mapping), (str, T))
+        self.assertEqual(get_generic_args_for(B[int], A), (typing.List[int],))
+        self.assertEqual(
+            get_generic_args_for(B[int], abc.Mapping),
+            (str, typing.List[int]),
+        )
+        self.assertEqual(get_generic_args_for(C[int], typing.Mapping), (int, int))
+        self.assertEqual(get_generic_args_for(typing.Sized, typing.Sized), ())
+        self.assertIsNone(get_generic_args_for(A, typing.Sequence))
+        self.assertIsNone(get_generic_args_for(int, typing.Mapping))
+
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    def test_builtin(self):
+        K = typing.TypeVar('K')  # noqa: N806
+        V = typing.TypeVar('V')  # noqa: N806
+
+        class Sub(typing.Dict[str, int]):
+            pass
+
+        class SubL(typing.List[V]):
+            pass
+
+        class Swapped(typing.Dict[V, K]):
+            pass
+
+        self.assertEqual(
+            get_generic_args_for(typing.Dict[str, int], typing.Mapping),
+            (str, int),
+        )
+        self.assertEqual(get_generic_args_for(typing.List[int], typing.Iterable), (int,))
+        self.assertEqual(get_generic_args_for(Sub, typing.Mapping), (str, int))
+        self.assertEqual(get_generic_args_for(Sub, abc.Iterable), (str,))
+        self.assertEqual(get_generic_args_for(SubL[int], typing.Sequence), (int,))
+        self.assertEqual(get_generic_args_for(SubL, typing.Sequence), (V,))
+        self.assertEqual(
+            get_generic_args_for(Swapped[int, str], typing.Mapping),
+            (int, str),
+        )
+        self.assertIsNone(get_generic_args_for(Sub, typing.Sequence))
+
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    @skipIf(not hasattr(typing, 'Counter'), 'requires typing.Counter')
+    def test_counter(self):
+        counter = typing.Counter[str]
+        self.assertEqual(get_generic_args_for(counter, typing.Mapping), (str, int))
+        self.assertEqual(get_generic_args_for(counter, typing.Iterable), (str,))
+        self.assertTrue(extras.is_subtype(counter, typing.Mapping[str, int]))
+        self.assertFalse(extras.is_subtype(counter, typing.Mapping[int, str]))
+
+    def test_bare_base(self):
+        class A(typing.Mapping):
+            pass
+
+        self.assertEqual(get_generic_args_for(A, typing.Mapping), ())
+        self.assertEqual(get_generic_args_for(A, typing.Iterable), ())
+
+
+class SyntheticTypesTestCase(TestCase):
+    def test_count(self):
+        types = list(build_synthetic_types(500, depth=2, fan_out=3, arity=2))
+        self.assertEqual(len(types), 500)
+        self.assertEqual(len(set(types)), 500)
+        self.assertEqual(list(build_synthetic_types(0)), [])
+
+    def test_seed(self):
+        def names(seed):
+            return [
+                [base.__name__ for base in type_.__bases__]
+                for type_ in build_synthetic_types(
+                    50, depth=3, diamonds=0.5, specialise=False, seed=seed)
+            ]
+
+        self.assertEqual(names(1), names(1))
+
+    def test_diamonds(self):
+        types = list(build_synthetic_types(
+            40, depth=3, fan_out=3, diamonds=1.0, specialise=False))
+        self.assertTrue(any(
+            len(get_parents(type_)) > len(type_.__mro__) for type_ in types
+        ))
+        self.assertTrue(all(isinstance(type_, type) for type_ in types))
+
+
+class StatsTestCase(TestCase):
+    def setUp(self):
+        stats_reset()
+        stats_enable()
+        self.addCleanup(stats_reset)
+        self.addCleanup(stats_enable, False)
+
+    def test_branches(self):
+        T = typing.TypeVar('T')  # noqa: N806
+
+        self.assertEqual(get_typing(T), (typing.TypeVar, T))
+        self.assertEqual(get_typing(int), (int, int))
+        self.assertEqual(get_args(typing.Mapping[str, int]), (str, int))
+        snapshot = stats()
+        self.assertEqual(snapshot['get_typing']['branches']['TypeVar']['calls'], 1)
+        self.assertEqual(snapshot['get_typing']['branches']['LITERAL_TYPES']['calls'], 1)
+        self.assertEqual(snapshot['get_args']['calls'], 1)
+        self.assertEqual(
+            snapshot['get_typing']['calls'],
+            sum(b['calls'] for b in snapshot['get_typing']['branches'].values()),
+        )
+
+        stats_reset()
+        self.assertEqual(stats(), {})
+
+    def test_disable(self):
+        get_typing_module = sys.modules['typing_inspect_lib.core.get_typing']
+        self.assertTrue(all(
+            hasattr(resolver, 'resolver')
+            for resolver in get_typing_module._RESOLVERS.values()
+        ))
+        stats_enable(False)
+        self.assertFalse(any(
+            hasattr(resolver, 'resolver')
+            for resolver in get_typing_module._RESOLVERS.values()
+        ))
+        get_typing(int)
+        self.assertEqual(stats(), {})
+
+
+class ExplainTestCase(TestCase):
+    def test_result(self):
+        T = typing.TypeVar('T')  # noqa: N806
+
+        types = [int, T, typing.Mapping, typing.Mapping[str, int], [int], (int, [int])]
+        for type_ in types:
+            explanation = explain(type_)
+            self.assertEqual(explanation.result, get_typing(type_), msg=str(type_))
+            self.assertEqual(explanation.steps[0].name, '_RESOLVERS')
+            self.assertEqual(explanation.steps[0].key, type(type_))
+
+    def test_swallowed(self):
+        steps = {step.name: step for step in explain((int, [int])).steps}
+        self.assertEqual(steps['_KNOWN'].error, 'TypeError')
+        steps = {step.name: step for step in explain(int).steps}
+        self.assertEqual(steps['_KNOWN'].value, (int, int))
+        self.assertIsNone(steps['_KNOWN'].error)
+
+
+class IterMroOrigTestCase(TestCase):
+    def setUp(self):
+        module = sys.modules['typing_inspect_lib.extras.get_parents']
+        get_bases_ = module.get_bases
+        self.calls = []
+
+        def get_bases(type_):
+            self.calls.append(type_)
+            return get_bases_(type_)
+
+        module.get_bases = get_bases
+        self.addCleanup(setattr, module, 'get_bases', get_bases_)
+
+    def test_early_termination(self):
+        T = typing.TypeVar('T')  # noqa: N806
+
+        class A(typing.Generic[T]):
+            pass
+
+        class B(A[T]):
+            pass
+
+        class C(B[int]):
+            pass
+
+        mro = extras.iter_mro_orig(C)
+        self.assertEqual(next(mro).class_, C)
+        self.assertEqual(self.calls, [])
+        self.assertEqual(next(mro).class_, B)
+        self.assertEqual(self.calls, [C])
+        self.assertEqual(tuple(mro), extras.get_mro_orig(C)[2:])
+
+        del self.calls[:]
+        parents = extras.iter_parents(C)
+        self.assertEqual([next(parents).class_, next(parents).class_], [C, B])
+        self.assertEqual(self.calls, [C])
+
+
+class WalkTestCase(TestCase):
+    def test_order(self):
+        type_ = typing.Dict[str, typing.List[int]]
+        self.assertEqual(
+            [(node.type, node.path) for node in extras.walk(type_)],
+            [(type_, ()), (str, (0,)), (typing.List[int], (1,)), (int, (1, 0))],
+        )
+        self.assertEqual(
+            [node.path for node in extras.walk(type_, 'post')],
+            [(0,), (1, 0), (1,), ()],
+        )
+        with self.assertRaises(ValueError) as _:  # noqa: F841
+            list(extras.walk(type_, 'in'))
+
+    def test_shared(self):
+        T = typing.TypeVar('T')  # noqa: N806
+
+        class A(typing.Generic[T]):
+            pass
+
+        # A new class, so typing can't return arguments cached from other tests.
+        a_int = A[int]
+        nodes = extras.walk(typing.Tuple[a_int, a_int])
+        nodes = [node for node in nodes if node.type is a_int]
+        self.assertEqual([node.path for node in nodes], [(0,), (1,)])
+        self.assertIs(nodes[0].type_info, nodes[1].type_info)
+        self.assertEqual(nodes[0].type_info, get_type_info(a_int))
+
+    def test_deep(self):
+        type_ = int
+        for _ in range(300):
+            type_ = typing.List[type_]
+        paths = [node.path for node in extras.walk(type_)]
+        self.assertEqual(len(paths), 301)
+        self.assertEqual(paths[-1], (0,) * 300)
+
+
+class FoldTestCase(TestCase):
+    def setUp(self):
+        self.calls = []
+
+        def name(type_, type_info, args):
+            self.calls.append(type_)
+            if type_info is None or not args:
+                return type_.__name__
+            return '{0}[{1}]'.format(type_info.class_.__name__, ', '.join(args))
+
+        self.fold = extras.Fold(name)
+        self.fold.register(typing.Union, lambda type_, type_info, args: ' | '.join(args))
+
+    def test_handlers(self):
+        T = typing.TypeVar('T')  # noqa: N806
+        UserId = typing.NewType('UserId', int)  # noqa: N806
+
+        class A(typing.Mapping[str, T]):
+            pass
+
+        self.fold.register(
+            typing.TypeVar,
+            lambda type_, type_info, args: '~' + type_.__name__,
+        )
+        self.fold.register(typing_.NewType, lambda type_, type_info, args: 'UserId')
+
+        @self.fold.register(abc.Mapping)
+        def mapping(type_, type_info, args):  # pylint: disable=unused-argument
+            return 'Mapping'
+
+        self.assertEqual(self.fold(typing.Union[int, T]), 'int | ~T')
+        self.assertEqual(self.fold(typing.Optional[UserId]), 'UserId | NoneType')
+        self.assertEqual(self.fold(A[int]), 'Mapping')
+        self.assertEqual(self.fold(typing.List[int]), 'list[int]')
+
+    def test_shared(self):
+        T = typing.TypeVar('T')  # noqa: N806
+
+        class A(typing.Generic[T]):
+            pass
+
+        a_int = A[int]
+        self.assertEqual(self.fold(typing.Union[a_int, str]), 'A[int] | str')
+        calls = len(self.calls)
+        self.assertEqual(self.fold(typing.Tuple[a_int, a_int]), 'tuple[A[int], A[int]]')
+        self.assertEqual(len(self.calls), calls + 1)
+
+    def test_missing(self):
+        with self.assertRaises(ValueError) as _:  # noqa: F841
+            extras.Fold()(int)
+
+    def test_registered(self):
+        class A(typing.Dict[str, int]):
+            pass
+
+        self.fold.register(typing.Mapping, lambda type_, type_info, args: 'Mapping')
+        self.fold.register(
+            abc.MutableMapping,
+            lambda type_, type_info, args: 'MutableMapping',
+        )
+        self.fold.register(object, lambda type_, type_info, args: 'object')
+        self.assertEqual(self.fold(typing.Dict[str, int]), 'MutableMapping')
+        self.assertEqual(self.fold(A), 'MutableMapping')
+        self.assertEqual(self.fold(typing.Mapping[str, int]), 'Mapping')
+        self.assertEqual(self.fold(typing.List[int]), 'object')
+
+    @skipIf(VERSION >= (3, 10, 0), 'NewTypes are classes after 3.9')
+    def test_new_type(self):
+        UserId = typing.NewType('UserId', int)  # noqa: N806
+
+        self.fold.register(typing.NewType, lambda type_, type_info, args: 'NewType')
+        self.assertEqual(self.fold(UserId), 'NewType')
+
+
+class GetValidatorTestCase(TestCase):
+    def assertValidates(self, type_, valid, invalid):
+        validate = extras.get_validator(type_)
+        for value in valid:
+            self.assertIs(validate(value), True, msg=repr((type_, value)))
+        for value in invalid:
+            self.assertIs(validate(value), False, msg=repr((type_, value)))
+
+    @skipIf(VERSION >= (3, 9, 0), 'special types are not found after 3.8')
+    def test_containers(self):
+        self.assertValidates(
+            typing.List[typing.Dict[str, typing.Union[int, str]]],
+            [[], [{}], [{'a': 1, 'b': 'c'}]],
+            [{}, [{'a': 1.0}], [{1: 1}], [[]]],
+        )
+        self.assertValidates(typing.Tuple[int, ...], [(), (1, 2)], [(1, 'a'), [1]])
+        self.assertValidates(typing.Tuple[int, str], [(1, 'a')], [(1,), (1, 2)])
+        self.assertValidates(typing.Tuple[()], [()], [(1,)])
+        self.assertValidates(typing.Iterator[int], [iter(['a'])], [[1]])
+
+    @skipIf(VERSION >= (3, 9, 0), 'special types are not found after 3.8')
+    def test_special(self):
+        T = typing.TypeVar('T', bound=int)  # noqa: N806
+        C = typing.TypeVar('C', int, str)  # noqa: N806
+        UserId = typing.NewType('UserId', int)  # noqa: N806
+
+        self.assertValidates(typing.Any, [1, None], [])
+        self.assertValidates(typing.Optional[typing.List[int]], [None, [1]], [[None], 1])
+        self.assertValidates(typing.Union[typing.List[int], int], [[1], 1], [[None], 'a'])
+        self.assertValidates(T, [1, True], ['a'])
+        self.assertValidates(C, [1, 'a'], [1.0])
+        self.assertValidates(UserId, [1], ['a'])
+        self.assertValidates(typing.Type[int], [int, bool], [str, 1])
+        self.assertValidates(typing.Callable[[int], str], [len], [1])
+        self.assertValidates(object, [1, None], [])
+
+    def test_cache(self):
+        type_ = typing.List[int]
+        self.assertIs(extras.get_validator(type_), extras.get_validator(type_))
+        self.assertIn('for ', extras.get_validator(type_).source)
+
+    def test_unknown(self):
+        with self.assertRaises(TypeError) as _:  # noqa: F841
+            extras.get_validator('int')
+
+    @skipIf(VERSION < (3, 7, 0), 'explicit Generic bases are not found before 3.7')
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    def test_parameter_order(self):
+        K = typing.TypeVar('K')  # noqa: N806
+        V = typing.TypeVar('V')  # noqa: N806
+
+        class Swapped(typing.Dict[V, K], typing.Generic[K, V]):
+            pass
+
+        class SubL(typing.List[V]):
+            pass
+
+        self.assertValidates(
+            Swapped[int, str],
+            [Swapped({'a': 1})],
+            [Swapped({1: 'a'}), {'a': 1}],
+        )
+        self.assertValidates(SubL[int], [SubL([1])], [SubL(['a']), [1]])
+
+    def test_uncheckable(self):
+        if VERSION < (3, 7, 0):
+            type_ = typing.Generic
+        elif hasattr(typing, 'Protocol'):
+            class Proto(typing.Protocol):  # pylint: disable=no-member
+                pass
+
+            type_ = Proto
+        else:
+            self.skipTest('every class can be checked')
+        with self.assertRaises(TypeError) as context:
+            extras.get_validator(type_)
+        self.assertIn("Can't validate", str(context.exception))
+
+    def test_none(self):
+        validate = extras.get_validator(None)
+        self.assertIs(validate, extras.get_validator(type(None)))
+        self.assertTrue(validate(None))
+        self.assertFalse(validate(0))
+        self.assertTrue(extras.is_instance(None, None, mode='first'))
+
+    def test_bounded(self):
+        extras.get_validator.cache_clear()
+
+        class A:
+            pass
+
+        ref = weakref.ref(A)
+        extras.get_validator(A)
+        del A
+        maxsize = extras.get_validator.cache_info().maxsize
+        for _ in range(maxsize):
+            extras.get_validator(type('B', (object,), {}))
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertEqual(extras.get_validator.cache_info().currsize, maxsize)
+        extras.get_validator.cache_clear()
+
+
+class IsInstanceTestCase(TestCase):
+    def test_modes(self):
+        list_ = typing.List[int]
+        self.assertFalse(extras.is_instance([1, 2, 'a'], list_))
+        self.assertTrue(extras.is_instance([1, 2, 'a'], list_, mode='first', limit=2))
+        self.assertFalse(extras.is_instance([1, 2, 'a'], list_, mode='first', limit=3))
+        self.assertTrue(extras.is_instance(list(range(1000)), list_, mode='sample'))
+        self.assertFalse(extras.is_instance(['a'] * 1000, list_, mode='sample'))
+        self.assertTrue(extras.is_instance({1, 2}, typing.Set[int], mode='sample'))
+        self.assertFalse(extras.is_instance('a', list_, mode='sample'))
+
+    def test_nested(self):
+        type_ = typing.Union[typing.List[int], typing.Dict[str, typing.List[int]]]
+        self.assertTrue(extras.is_instance({'a': [1, 'b']}, type_, mode='first', limit=1))
+        self.assertFalse(extras.is_instance({'a': [1, 'b']}, type_))
+        self.assertFalse(extras.is_instance({1: [1]}, type_, mode='first', limit=1))
+
+    def test_mode(self):
+        with self.assertRaises(ValueError) as _:  # noqa: F841
+            extras.is_instance([], typing.List[int], mode='some')
+
+
+class IsSubtypeTestCase(TestCase):
+    def assertSubtypes(self, subtypes, not_subtypes):
+        for left, right in subtypes:
+            self.assertTrue(extras.is_subtype(left, right), msg=repr((left, right)))
+        for left, right in not_subtypes:
+            self.assertFalse(extras.is_subtype(left, right), msg=repr((left, right)))
+
+    def test_classes(self):
+        self.assertSubtypes(
+            [(bool, int), (int, object), (int, typing.Any), (typing.Any, int)],
+            [(int, bool), (int, str)],
+        )
+
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    def test_variance(self):
+        T_co = typing.TypeVar('T_co', covariant=True)  # noqa: N806
+        T_contra = typing.TypeVar('T_contra', contravariant=True)  # noqa: N806
+
+        class Box(typing.Generic[T_co]):
+            pass
+
+        class Sink(typing.Generic[T_contra]):
+            pass
+
+        class IntBox(Box[int]):
+            pass
+
+        self.assertSubtypes(
+            [
+                (typing.List[bool], typing.Sequence[int]),
+                (typing.Dict[str, bool], typing.Mapping[str, int]),
+                (Box[bool], Box[int]),
+                (Sink[int], Sink[bool]),
+                (IntBox, Box[int]),
+                (typing.List, typing.Sequence[int]),
+            ],
+            [
+                (typing.List[bool], typing.List[int]),
+                (typing.Mapping[str, int], typing.Dict[str, int]),
+                (Box[int], Box[bool]),
+                (Sink[bool], Sink[int]),
+                (IntBox, Box[bool]),
+            ],
+        )
+
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    def test_special(self):
+        B = typing.TypeVar('B', bound=int)  # noqa: N806
+        C = typing.TypeVar('C', int, str)  # noqa: N806
+        UserId = typing.NewType('UserId', int)  # noqa: N806
+        self.assertSubtypes(
+            [
+                (int, typing.Optional[int]),
+                (typing.Union[int, bool], int),
+                (typing.Tuple[int, bool], typing.Tuple[int, ...]),
+                (typing.Tuple[int, bool], typing.Sequence[int]),
+                (typing.Tuple[()], typing.Tuple[int, ...]),
+                (typing.Callable[[int], bool], typing.Callable[[bool], int]),
+                (typing.Callable[..., int], typing.Callable[[str], int]),
+                (typing.Type[bool], typing.Type[int]),
+                (UserId, int),
+                (bool, B),
+                (str, C),
+                (C, typing.Union[int, str]),
+                (B, typing.Optional[int]),
+                (UserId, typing.Union[UserId, str]),
+                (UserId, typing.Union[int, str]),
+            ],
+            [
+                (typing.Optional[int], int),
+                (typing.Tuple[int, ...], typing.Tuple[int, int]),
+                (typing.Tuple[int], typing.Tuple[int, int]),
+                (typing.Tuple[int, str], typing.Sequence[int]),
+                (typing.Callable[[bool], int], typing.Callable[[int], int]),
+                (typing.Type[int], typing.Type[bool]),
+                (int, UserId),
+                (str, B),
+                (C, int),
+                (C, typing.Union[int, bytes]),
+                (B, typing.Union[bool, str]),
+            ],
+        )
+
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    def test_builtin_bases(self):
+        K = typing.TypeVar('K')  # noqa: N806
+        V = typing.TypeVar('V')  # noqa: N806
+
+        class Sub(typing.Dict[str, int]):
+            pass
+
+        class SubL(typing.List[V]):
+            pass
+
+        class Swapped(typing.Dict[V, K]):
+            pass
+
+        self.assertSubtypes(
+            [
+                (Sub, typing.Mapping[str, int]),
+                (SubL[bool], typing.Sequence[int]),
+                (Swapped[int, str], typing.Mapping[int, str]),
+            ],
+            [
+                (Sub, typing.Mapping[int, int]),
+                (SubL[str], typing.Sequence[int]),
+                (Swapped[int, str], typing.Mapping[str, int]),
+            ],
+        )
+
+    def test_memo(self):
+        left = typing.List[bool]
+        right = typing.Sequence[int]
+        extras.is_subtype.cache_clear()
+        self.assertTrue(extras.is_subtype(left, right))
+        hits = extras.is_subtype.cache_info().hits
+        self.assertTrue(extras.is_subtype(left, right))
+        self.assertEqual(extras.is_subtype.cache_info().hits, hits + 1)
+        extras.is_subtype.cache_clear()
+        self.assertEqual(extras.is_subtype.cache_info().currsize, 0)
+
+    def test_weak(self):
+        class A:
+            pass
+
+        ref = weakref.ref(A)
+        self.assertFalse(extras.is_subtype(A, int))
+        self.assertFalse(extras.is_subtype(int, A))
+        del A
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+class UnifyTestCase(TestCase):
+    def setUp(self):
+        self.K = typing.TypeVar('K')
+        self.V = typing.TypeVar('V')
+
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    def test_generics(self):
+        K, V = self.K, self.V  # noqa: N806
+
+        class A(typing.Mapping[str, V]):
+            pass
+
+        pattern = typing.Mapping[K, typing.List[V]]
+        self.assertEqual(
+            extras.unify(pattern, typing.Dict[str, typing.List[int]]),
+            {K: str, V: int},
+        )
+        self.assertIsNone(extras.unify(pattern, typing.Dict[str, typing.Set[int]]))
+        self.assertEqual(extras.unify(typing.Mapping[K, V], A[int]), {K: str, V: int})
+        self.assertEqual(
+            extras.unify(typing.Mapping[K, K], typing.Dict[int, int]),
+            {K: int},
+        )
+        self.assertIsNone(extras.unify(typing.Mapping[K, K], typing.Dict[int, str]))
+        self.assertIsNone(extras.unify(typing.Mapping[str, V], typing.Dict[int, int]))
+        self.assertEqual(extras.unify(typing.Dict[K, V], dict), {})
+
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    def test_special(self):
+        K, V = self.K, self.V  # noqa: N806
+        self.assertEqual(extras.unify(typing.Optional[K], typing.Optional[int]), {K: int})
+        self.assertEqual(extras.unify(typing.Optional[K], type(None)), {})
+        self.assertEqual(
+            extras.unify(typing.Tuple[K, V], typing.Tuple[int, str]),
+            {K: int, V: str},
+        )
+        self.assertEqual(
+            extras.unify(typing.Tuple[K, ...], typing.Tuple[int, int]),
+            {K: int},
+        )
+        self.assertIsNone(extras.unify(typing.Tuple[K, ...], typing.Tuple[int, str]))
+        self.assertEqual(
+            extras.unify(typing.Callable[[K], V], typing.Callable[[int], str]),
+            {K: int, V: str},
+        )
+
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    def test_variance(self):
+        K, V = self.K, self.V  # noqa: N806
+
+        class Sub(typing.Dict[str, int]):
+            pass
+
+        self.assertIsNone(
+            extras.unify(typing.Callable[[int], V], typing.Callable[[bool], str]),
+        )
+        self.assertEqual(
+            extras.unify(typing.Callable[[bool], V], typing.Callable[[int], str]),
+            {V: str},
+        )
+        self.assertEqual(
+            extras.unify(
+                typing.Callable[[typing.List[K]], V],
+                typing.Callable[[typing.Sequence[int]], str],
+            ),
+            {K: int, V: str},
+        )
+        self.assertIsNone(
+            extras.unify(
+                typing.Callable[[typing.Sequence[K]], V],
+                typing.Callable[[typing.List[int]], str],
+            ),
+        )
+        self.assertIsNone(
+            extras.unify(typing.List[typing.Sequence[K]], typing.List[typing.List[int]]),
+        )
+        self.assertEqual(
+            extras.unify(
+                typing.List[typing.Sequence[K]],
+                typing.List[typing.Sequence[int]],
+            ),
+            {K: int},
+        )
+        self.assertEqual(
+            extras.unify(
+                typing.Sequence[typing.Sequence[K]],
+                typing.List[typing.List[int]],
+            ),
+            {K: int},
+        )
+        self.assertEqual(extras.unify(typing.Mapping[K, V], Sub), {K: str, V: int})
+        self.assertIsNone(extras.unify(typing.Mapping[int, V], Sub))
+
+    def test_type_vars(self):
+        B = typing.TypeVar('B', bound=int)  # noqa: N806
+        C = typing.TypeVar('C', int, str)  # noqa: N806
+        self.assertEqual(extras.unify(B, bool), {B: bool})
+        self.assertIsNone(extras.unify(B, str))
+        self.assertEqual(extras.unify(C, bool), {C: int})
+        self.assertIsNone(extras.unify(C, float))
+        self.assertEqual(
+            extras.unify(typing.Callable[[C], None], typing.Callable[[int], None]),
+            {C: int},
+        )
+        self.assertIsNone(
+            extras.unify(typing.Callable[[C], None], typing.Callable[[bool], None]),
+        )
+
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    def test_type_vars_invariant(self):
+        C = typing.TypeVar('C', int, str)  # noqa: N806
+        self.assertEqual(extras.unify(typing.List[C], typing.List[int]), {C: int})
+        self.assertIsNone(extras.unify(typing.List[C], typing.List[bool]))
+
+    def test_callable_join(self):
+        T = typing.TypeVar('T')  # noqa: N806
+        pattern = typing.Callable[[T], T]
+        self.assertEqual(
+            extras.unify(pattern, typing.Callable[[int], bool]),
+            {T: int},
+        )
+        self.assertIsNone(extras.unify(pattern, typing.Callable[[int], str]))
+        self.assertIsNone(extras.unify(pattern, typing.Callable[[bool], int]))
+
+    def test_copy(self):
+        bindings = extras.unify(self.K, int)
+        bindings[self.V] = str
+        self.assertEqual(extras.unify(self.K, int), {self.K: int})
+
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    def test_memo(self):
+        extras.unify.cache_clear()
+        pattern = typing.Mapping[self.K, self.V]
+        self.assertEqual(extras.unify(pattern, typing.Dict[str, int]), {
+            self.K: str,
+            self.V: int,
+        })
+        info = extras.unify.cache_info()
+        self.assertEqual(extras.unify(pattern, typing.Dict[str, int]), {
+            self.K: str,
+            self.V: int,
+        })
+        self.assertEqual(extras.unify.cache_info().hits, info.hits + 1)
+        self.assertEqual(extras.unify.cache_info().currsize, info.currsize)
+        extras.unify.cache_clear()
+        self.assertEqual(extras.unify.cache_info().currsize, 0)
+
+    def test_weak(self):
+        class A:
+            pass
+
+        ref = weakref.ref(A)
+        self.assertEqual(extras.unify(self.K, A), {self.K: A})
+        self.assertIsNone(extras.unify(int, A))
+        del A
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+class MatcherTestCase(TestCase):
+    def setUp(self):
+        self.T = typing.TypeVar('T')
+        self.X = typing.TypeVar('X', bound=int)
+        self.patterns = [
+            (typing.Mapping[str, typing.Any], 'mapping str'),
+            (typing.Sequence[self.T], 'sequence'),
+            (typing.Optional[self.X], 'optional int'),
+            (typing.Tuple[int, ...], 'tuple'),
+            (typing.Mapping[self.T, self.T], 'mapping'),
+        ]
+        self.matcher = extras.Matcher(self.patterns)
+
+    def _scan(self, type_):
+        for pattern, value in self.patterns:
+            bindings = extras.unify(pattern, type_)
+            if bindings is not None:
+                return pattern, value, bindings
+        return None
+
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    def test_match(self):
+        types = [
+            typing.List[int], typing.Dict[str, int], typing.Dict[int, int],
+            typing.Dict[int, str], int, type(None), typing.Optional[bool],
+            typing.Tuple[int, int], float, typing.Set[int], typing.Any,
+            typing.Union[typing.List[int], typing.Tuple[int, int]],
+        ]
+        for type_ in types:
+            match = self.matcher.match(type_)
+            expected = self._scan(type_)
+            self.assertEqual(tuple(match or ()), tuple(expected or ()), msg=type_)
+        match = self.matcher.match(typing.List[int])
+        self.assertEqual(match.value, 'sequence')
+        self.assertEqual(match.bindings, {self.T: int})
+        self.assertIsNone(self.matcher.match(float))
+
+    def test_register(self):
+        self.assertIsNone(self.matcher.match(float))
+        self.matcher.register(float, 'float')
+        self.assertEqual(self.matcher.match(float).value, 'float')
+
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    def test_copy(self):
+        self.matcher.match(typing.List[int]).bindings.clear()
+        self.assertTrue(self.matcher.match(typing.List[int]).bindings)
+
+
+class SubstituteTestCase(TestCase):
+    def setUp(self):
+        self.K = typing.TypeVar('K')
+        self.V = typing.TypeVar('V')
+        self.bindings = {self.K: str, self.V: int}
+
+    def test_substitute(self):
+        K, V = self.K, self.V  # noqa: N806
+        self.assertEqual(
+            extras.substitute(typing.Dict[K, typing.List[V]], self.bindings),
+            typing.Dict[str, typing.List[int]],
+        )
+        self.assertEqual(
+            extras.substitute(typing.Callable[[K], typing.Optional[V]], self.bindings),
+            typing.Callable[[str], typing.Optional[int]],
+        )
+        self.assertEqual(
+            extras.substitute(typing.Tuple[K, ...], self.bindings),
+            typing.Tuple[str, ...],
+        )
+        self.assertEqual(
+            extras.substitute(typing.Dict[K, V], {K: str}),
+            typing.Dict[str, V],
+        )
+        self.assertIs(extras.substitute(K, self.bindings), str)
+
+    def test_untouched(self):
+        K = self.K  # noqa: N806
+
+        class A(typing.Generic[K]):
+            pass
+
+        type_ = typing.Dict[str, int]
+        self.assertIs(extras.substitute(type_, self.bindings), type_)
+        self.assertIs(extras.substitute(A, self.bindings), A)
+        self.assertIs(extras.substitute(int, self.bindings), int)
+
+        list_ = typing.List[A[int]]
+        type_ = typing.Tuple[list_, K]
+        new = extras.substitute(type_, self.bindings)
+        self.assertIs(get_args(new)[0], list_)
+        self.assertIs(extras.substitute(type_, self.bindings), new)
+
+    def test_memo(self):
+        extras.substitute.cache_clear()
+        type_ = typing.Dict[self.K, self.V]
+        new = extras.substitute(type_, self.bindings)
+        info = extras.substitute.cache_info()
+        self.assertIs(extras.substitute(type_, self.bindings), new)
+        self.assertEqual(extras.substitute.cache_info().hits, info.hits + 1)
+        self.assertEqual(extras.substitute.cache_info().currsize, info.currsize)
+        extras.substitute.cache_clear()
+        self.assertEqual(extras.substitute.cache_info().currsize, 0)
+
+    def test_weak(self):
+        class A(typing.Generic[self.K]):
+            pass
+
+        ref = weakref.ref(A)
+        self.assertIs(extras.substitute(A, self.bindings), A)
+        del A
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+class CanonicalTestCase(TestCase):
+    def setUp(self):
+        self.T = typing.TypeVar('T')
+
+    def test_equal(self):
+        T = self.T  # noqa: N806
+        type_ = extras.canonical(typing.List[T][int])
+        self.assertEqual(type_, typing.List[int])
+        self.assertIs(extras.canonical(typing.List[int]), type_)
+        for type_ in (int, T, typing.List, typing.Tuple[()], typing.Callable[..., int]):
+            self.assertEqual(extras.canonical(type_), type_)
+
+    @skipIf(VERSION < (3, 7, 0), 'arguments of nested aliases are not found before 3.7')
+    def test_nested(self):
+        T = self.T  # noqa: N806
+        self.assertIs(
+            extras.canonical(typing.Dict[str, typing.List[T]][int]),
+            extras.canonical(typing.Dict[str, typing.List[int]]),
+        )
+        self.assertIsNot(
+            extras.canonical(typing.Dict[str, typing.List[T]][int]),
+            extras.canonical(typing.Dict[str, typing.Set[T]][int]),
+        )
+
+    def test_union(self):
+        type_ = extras.canonical(typing.Union[int, str])
+        self.assertEqual(type_, typing.Union[int, str])
+        self.assertIs(extras.canonical(typing.Union[str, int]), type_)
+        self.assertIs(
+            extras.canonical(typing.List[typing.Union[str, int]]),
+            extras.canonical(typing.List[typing.Union[int, str]]),
+        )
+        self.assertIs(
+            extras.canonical(typing.Optional[typing.List[self.T][int]]),
+            extras.canonical(typing.Union[None, typing.List[int]]),
+        )
+
+    def test_weak(self):
+        T = self.T  # noqa: N806
+
+        class A(typing.Generic[T]):
+            pass
+
+        ref = weakref.ref(A)
+        extras.canonical(A[int])
+        extras.canonical(typing.List[typing.Union[A[int], str]])
+        del A
+        for cleanup in typing._cleanups:  # pylint: disable=protected-access
+            cleanup()
+        gc.collect()
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+class FingerprintTestCase(TestCase):
+    def setUp(self):
+        self.T = typing.TypeVar('T', bound=int)
+
+    def test_equal(self):
+        T = self.T  # noqa: N806
+        pairs = [
+            (typing.List[T][int], typing.List[int]),
+            (typing.Union[int, str], typing.Union[str, int]),
+            (typing.Optional[int], typing.Union[None, int]),
+            (list, typing.List),
+            (typing.TypeVar('T', bound=int), T),
+        ]
+        for left, right in pairs:
+            self.assertEqual(extras.fingerprint(left), extras.fingerprint(right))
+
+    def test_distinct(self):
+        T = self.T  # noqa: N806
+        types = [
+            int, str, object, T, typing.TypeVar('T'), typing.TypeVar('T', int, str),
+            typing.TypeVar('T', covariant=True), 'T', typing.List['T'],
+            typing.List[int], typing.Sequence[int], typing.List[T],
+            typing.Dict[str, int], typing.Dict[int, str], typing.Tuple[()],
+            typing.Tuple[int, ...], typing.Callable[..., int],
+            typing.Callable[[], int], typing.Callable[[int], int],
+        ]
+        fingerprints = [extras.fingerprint(type_) for type_ in types]
+        self.assertEqual(len(set(fingerprints)), len(types))
+
+    @skipIf(VERSION >= (3, 10, 0), 'NewTypes know their module from 3.10')
+    def test_new_type_module(self):
+        with self.assertRaises(TypeError) as _:  # noqa: F841
+            extras.fingerprint(typing.NewType('UserId', int))
+
+    @skipIf(VERSION < (3, 10, 0), 'NewTypes do not know their module before 3.10')
+    def test_new_type(self):
+        user_id = typing.NewType('UserId', int)
+        other = typing.NewType('UserId', int)
+        other.__module__ = 'other'
+        self.assertNotEqual(extras.fingerprint(user_id), extras.fingerprint(other))
+
+    def test_unstable(self):
+        with self.assertRaises(TypeError) as _:  # noqa: F841
+            extras.fingerprint(object())
+
+    def test_processes(self):
+        code = (
+            'import typing\n'
+            'from typing_inspect_lib import fingerprint\n'
+            'print(fingerprint(typing.Dict[str, typing.Union[int, typing.List[str]]]))'
+        )
+        type_ = typing.Dict[str, typing.Union[int, typing.List[str]]]
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(
+            path
+            for path in [
+                os.path.dirname(os.path.dirname(typing_inspect_lib.__file__)),
+                env.get('PYTHONPATH'),
+            ]
+            if path
+        )
+        for seed in ('1', '2'):
+            env['PYTHONHASHSEED'] = seed
+            output = subprocess.check_output([sys.executable, '-c', code], env=env)
+            self.assertEqual(output.decode('utf-8').strip(), extras.fingerprint(type_))
@@ -11,8 +11,9 @@ except ImportError:
     import collections as abc
 
 from typing_inspect_lib import (
-    get_args, get_bases, get_mro, get_mro_orig, get_parameters, get_type_var_info,
-    get_typing,
+    Matcher, canonical, fingerprint, get_args, get_bases, get_mro, get_mro_orig,
+    get_parameters, get_type_var_info, get_typing, get_validator, is_instance,
+    is_subtype, substitute, unify,
 )
 
 VERSION = sys.version_info[:3]
@@ -224,3 +225,80 @@ class SpecialTestCase(TestCase):
             )
 
         self.assertEqual(bases, get_mro_orig(T))
+
+
+class ExtrasTestCase(TestCase):
+    def test_get_validator(self):
+        validate = get_validator(typing.List[typing.Dict[str, Union[int, str]]])
+        self.assertTrue(validate([{'a': 1, 'b': 'c'}]))
+        self.assertFalse(validate([{'a': 1.0}]))
+
+    def test_is_instance(self):
+        self.assertFalse(is_instance([1, 2, 'a'], typing.List[int]))
+        self.assertTrue(is_instance([1, 2, 'a'], typing.List[int], mode='first', limit=2))
+        self.assertTrue(is_instance(
+            list(range(10 ** 6)), typing.List[int], mode='sample', limit=10,
+        ))
+
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    def test_is_subtype(self):
+        self.assertTrue(is_subtype(typing.List[bool], Sequence[int]))
+        self.assertFalse(is_subtype(typing.List[bool], typing.List[int]))
+        self.assertTrue(is_subtype(
+            typing.Callable[[int], bool], typing.Callable[[bool], int],
+        ))
+        self.assertTrue(is_subtype(typing.Tuple[int, bool], typing.Tuple[int, ...]))
+
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    def test_unify(self):
+        K = TypeVar('K')  # noqa: N806
+        V = TypeVar('V')  # noqa: N806
+
+        self.assertEqual(
+            unify(Mapping[K, typing.List[V]], typing.Dict[str, typing.List[int]]),
+            {K: str, V: int},
+        )
+        self.assertIsNone(
+            unify(Mapping[K, typing.List[V]], typing.Dict[str, typing.Set[int]]),
+        )
+
+    @skipIf(VERSION >= (3, 9, 0), 'arguments of aliases are not found after 3.8')
+    def test_matcher(self):
+        T = TypeVar('T')  # noqa: N806
+
+        matcher = Matcher([
+            (Sequence[T], 'sequence'),
+            (Mapping[str, typing.Any], 'mapping'),
+        ])
+        self.assertEqual(
+            matcher.match(typing.List[int]),
+            (Sequence[T], 'sequence', {T: int}),
+        )
+        self.assertEqual(matcher.match(typing.Dict[str, int]).value, 'mapping')
+        self.assertIsNone(matcher.match(int))
+
+    def test_substitute(self):
+        K = TypeVar('K')  # noqa: N806
+        V = TypeVar('V')  # noqa: N806
+
+        self.assertEqual(
+            substitute(typing.Dict[K, typing.List[V]], {K: str, V: int}),
+            typing.Dict[str, typing.List[int]],
+        )
+        type_ = typing.Dict[str, int]
+        self.assertIs(substitute(type_, {K: str}), type_)
+
+    def test_canonical(self):
+        T = TypeVar('T')  # noqa: N806
+
+        self.assertIs(canonical(typing.List[T][int]), canonical(typing.List[int]))
+        self.assertIs(canonical(Union[int, str]), canonical(Union[str, int]))
+        self.assertIs(canonical(int), int)
+
+    def test_fingerprint(self):
+        self.assertEqual(
+            fingerprint(typing.Dict[str, int]),
+            fingerprint(typing.Dict[str, int]),
+        )
+        self.assertEqual(fingerprint(Union[int, str]), fingerprint(Union[str, int]))
+        self.assertNotEqual(fingerprint(typing.List[int]), fingerprint(Sequence[int]))